@@ -2,17 +2,38 @@
 Budget tracking for paid tools.
 
 Maintains a ledger of API costs and enforces spending limits.
-Config lives at ~/.aleph/usage/budget.json, ledger at ~/.aleph/usage/ledger.json.
+Config lives at ~/.aleph/usage/budget.json, ledger at ~/.aleph/usage/ledger.jsonl
+(one JSON entry per line, append-only). Running totals for the current period
+are kept in ~/.aleph/.cache/budget-rollup.json so budget checks don't scan the
+ledger; writers serialize on a lock file next to it. Both are derived data, so
+they live in the gitignored cache dir rather than the tracked usage/ dir.
 """
 
+import bisect
+import fcntl
+import io
 import json
 import os
-from datetime import datetime, timezone
+import sys
+from collections import namedtuple
+from contextlib import contextmanager
+from operator import attrgetter, itemgetter
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 USAGE_DIR = Path.home() / ".aleph" / "usage"
 BUDGET_FILE = USAGE_DIR / "budget.json"
-LEDGER_FILE = USAGE_DIR / "ledger.json"
+LEDGER_FILE = USAGE_DIR / "ledger.jsonl"
+_LEGACY_LEDGER_FILE = USAGE_DIR / "ledger.json"
+CACHE_DIR = Path.home() / ".aleph" / ".cache"
+ROLLUP_FILE = CACHE_DIR / "budget-rollup.json"
+# Sidecar lock: the rollup itself is replaced by rename, so it can't hold one
+_ROLLUP_LOCK = CACHE_DIR / "budget-rollup.json.lock"
 
 DEFAULT_BUDGET = {
     "period": "monthly",       # "monthly" or "weekly"
@@ -21,18 +42,105 @@ DEFAULT_BUDGET = {
 }
 
 
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(data, indent=False):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+else:
+    _loads = json.loads
+
+    def _dumps(data, indent=False):
+        return json.dumps(data, indent=2 if indent else None).encode()
+
+
+# Parsed JSON keyed by path -> (mtime_ns, data). A warm process reuses the
+# parsed dict until the file changes on disk.
+_CACHE = {}
+
+
+def _load_cached(path, parse, default):
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        _CACHE.pop(path, None)
+        return default
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, "rb") as f:
+        data = parse(f)
+    _CACHE[path] = (mtime, data)
+    return data
+
+
 def _load_json(path, default):
-    if path.exists():
-        with open(path) as f:
-            return json.load(f)
-    return default
+    return _load_cached(path, lambda f: _loads(f.read()), default)
+
+
+def _parse_jsonl(f):
+    entries = []
+    for lineno, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            entry = _loads(line)
+        except ValueError:
+            entry = None
+        if not isinstance(entry, dict):
+            # A torn or partial write; skip it rather than fail every later read
+            print(f"budget: skipping unreadable line {lineno} of {LEDGER_FILE}", file=sys.stderr)
+            continue
+        entries.append(entry)
+    # Compact parallel rows for the period scans (see _entries_since)
+    return {"entries": entries, "rows": _to_rows(entries)}
+
 
+def _append_entries(entries):
+    """Append ledger entries as JSON lines. O(1) in the size of the ledger."""
+    LEDGER_FILE.parent.mkdir(parents=True, exist_ok=True)
+    _CACHE.pop(LEDGER_FILE, None)
+    with open(LEDGER_FILE, "ab") as f:
+        f.write(b"".join(_dumps(e) + b"\n" for e in entries))
 
-def _save_json(path, data):
+
+def _migrate_legacy_ledger():
+    """One-time conversion of the old whole-file ledger.json to JSON Lines.
+
+    Caller must hold _rollup_lock(). The existence checks happen under it,
+    so two tool runs starting together can't both migrate. The new ledger is
+    renamed into place whole, so unlocked readers never see it half-written.
+    """
+    if LEDGER_FILE.exists() or not _LEGACY_LEDGER_FILE.exists():
+        return
+    legacy = _load_json(_LEGACY_LEDGER_FILE, {"entries": []})
+    tmp = LEDGER_FILE.with_name(f"{LEDGER_FILE.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(b"".join(_dumps(e) + b"\n" for e in legacy.get("entries", [])))
+    _CACHE.pop(LEDGER_FILE, None)
+    os.replace(tmp, LEDGER_FILE)
+    _LEGACY_LEDGER_FILE.rename(_LEGACY_LEDGER_FILE.with_name("ledger.json.bak"))
+
+
+def _save_json(path, data, compact=False):
+    """Write JSON to path. Pretty-printed unless compact (machine-only files).
+
+    Written to a temp file and renamed over path, so readers never see a
+    half-written file.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    _CACHE.pop(path, None)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(_dumps(data, indent=not compact) + b"\n")
+    os.replace(tmp, path)
+
+
+@contextmanager
+def _rollup_lock():
+    """Hold the exclusive lock that serializes ledger appends and rollup writes."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(_ROLLUP_LOCK, "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
 
 
 def get_budget():
@@ -44,48 +152,169 @@ def get_budget():
     return budget
 
 
+def _read_ledger():
+    return _load_cached(LEDGER_FILE, _parse_jsonl, {"entries": []})
+
+
 def get_ledger():
     """Load the full ledger."""
-    return _load_json(LEDGER_FILE, {"entries": []})
+    if not LEDGER_FILE.exists() and _LEGACY_LEDGER_FILE.exists():
+        with _rollup_lock():
+            _migrate_legacy_ledger()
+    return _read_ledger()
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_ns(dt):
+    """Convert an aware datetime to integer nanoseconds since the epoch."""
+    return (dt - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def _entry_ns(entry):
+    """Entry timestamp in epoch ns. Entries logged before ts_ns existed fall back to ISO."""
+    ts_ns = entry.get("ts_ns")
+    if ts_ns is None:
+        ts_ns = _to_ns(datetime.fromisoformat(entry["timestamp"]))
+    return ts_ns
+
+
+# (period, UTC date) -> period start. Boundaries only move at day granularity.
+_PERIOD_START_CACHE = {}
 
 
 def _period_start(period):
     """Get the start of the current budget period."""
     now = datetime.now(timezone.utc)
+    key = (period, now.date())
+    cached = _PERIOD_START_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     if period == "monthly":
-        return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
     elif period == "weekly":
         # Monday of current week
         start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        start = start.replace(day=start.day - start.weekday())
-        return start
+        start -= timedelta(days=start.weekday())
     else:
         raise ValueError(f"Unknown budget period: {period}")
+    _PERIOD_START_CACHE[key] = start
+    return start
+
+
+# One ledger entry reduced to what the period math needs: epoch-ns, tool, cost
+Entry = namedtuple("Entry", "ts tool cost")
+_entry_ts = attrgetter("ts")
+
+
+def _to_rows(entries):
+    return [Entry(_entry_ns(e), e["tool"], e["cost"]) for e in entries]
+
+
+def _entries_since(ledger, cutoff_ns):
+    """Return Entry rows for everything logged at or after cutoff_ns (epoch ns).
+
+    Entries are appended in time order, so the cutoff is found by binary
+    search over integer timestamps.
+    """
+    rows = ledger.get("rows")
+    if rows is None:
+        rows = _to_rows(ledger["entries"])
+    idx = bisect.bisect_left(rows, cutoff_ns, key=_entry_ts)
+    return rows[idx:]
+
+
+def _compute_period_stats(ledger, start):
+    """Total spend and per-tool breakdown since start, in one pass over the ledger."""
+    spent = 0.0
+    by_tool = {}
+    get = by_tool.get
+    for _, tool, cost in _entries_since(ledger, _to_ns(start)):
+        spent += cost
+        by_tool[tool] = get(tool, 0.0) + cost
+    return spent, by_tool
+
+
+def _rollup_key(budget):
+    start = _period_start(budget["period"])
+    return start, f"{budget['period']}:{start.isoformat()}"
+
+
+def _load_rollup(key):
+    """The stored rollup if it is for key, else None (also if unreadable)."""
+    try:
+        rollup = _load_json(ROLLUP_FILE, None)
+    except ValueError:
+        return None
+    if isinstance(rollup, dict) and rollup.get("key") == key:
+        return rollup
+    return None
+
+
+def _current_rollup(budget):
+    """get_rollup() for callers already holding _rollup_lock()."""
+    start, key = _rollup_key(budget)
+    rollup = _load_rollup(key)
+    if rollup is not None:
+        return rollup
+
+    _migrate_legacy_ledger()
+    total, by_tool = _compute_period_stats(_read_ledger(), start)
+    rollup = {"key": key, "total": total, "by_tool": by_tool}
+    _save_json(ROLLUP_FILE, rollup, compact=True)
+    return rollup
+
+
+def get_rollup(budget=None):
+    """Load running totals for the current period.
+
+    The rollup is keyed by period and period start. When the key no longer
+    matches (new period, or the period setting changed), or the file can't
+    be parsed, it is rebuilt from the ledger once under the rollup lock and
+    then maintained incrementally by log_usage.
+    """
+    if budget is None:
+        budget = get_budget()
+    rollup = _load_rollup(_rollup_key(budget)[1])
+    if rollup is not None:
+        return rollup
+    with _rollup_lock():
+        return _current_rollup(budget)
+
+
+def _update_rollup(rollup, entries):
+    """Add freshly logged entries to the current period's rollup."""
+    for entry in entries:
+        tool = entry["tool"]
+        rollup["total"] += entry["cost"]
+        rollup["by_tool"][tool] = rollup["by_tool"].get(tool, 0.0) + entry["cost"]
+    _save_json(ROLLUP_FILE, rollup, compact=True)
 
 
 def spend_in_period(budget=None, ledger=None):
-    """Calculate total spend in the current budget period."""
+    """Calculate total spend in the current budget period.
+
+    Reads the rollup unless an explicit ledger is passed, in which case
+    the ledger is scanned directly.
+    """
     if budget is None:
         budget = get_budget()
     if ledger is None:
-        ledger = get_ledger()
+        return get_rollup(budget)["total"]
 
-    cutoff = _period_start(budget["period"]).isoformat()
-    total = 0.0
-    for entry in ledger["entries"]:
-        if entry["timestamp"] >= cutoff:
-            total += entry["cost"]
-    return total
+    return _compute_period_stats(ledger, _period_start(budget["period"]))[0]
 
 
-def check_budget(cost):
+def check_budget(cost, pending=0.0):
     """
     Check if a call costing $cost is within budget.
+    `pending` is spend not yet written to the ledger (see LedgerSession).
     Returns (allowed: bool, spend_so_far: float, limit: float, message: str).
     """
     budget = get_budget()
-    ledger = get_ledger()
-    spent = spend_in_period(budget, ledger)
+    spent = spend_in_period(budget) + pending
     limit = budget["limit"]
     remaining = limit - spent
 
@@ -102,50 +331,113 @@ def check_budget(cost):
         return True, spent, limit, f"WARNING: {msg} (soft limit, proceeding)"
 
 
-def log_usage(tool_name, cost, params=None, note=None):
-    """Record a tool call to the ledger."""
-    ledger = get_ledger()
-    entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "tool": tool_name,
-        "cost": cost,
-    }
+def _stamp(entries):
+    now = datetime.now(timezone.utc)
+    timestamp, ts_ns = now.isoformat(), _to_ns(now)
+    for entry in entries:
+        entry["timestamp"] = timestamp
+        entry["ts_ns"] = ts_ns
+
+
+def _make_entry(tool_name, cost, params=None, note=None):
+    entry = {"timestamp": None, "ts_ns": None, "tool": tool_name, "cost": cost}
+    _stamp([entry])
     if params:
         entry["params"] = params
     if note:
         entry["note"] = note
-    ledger["entries"].append(entry)
-    _save_json(LEDGER_FILE, ledger)
     return entry
 
 
+def _record(entries):
+    """Append entries to the ledger and fold them into the rollup.
+
+    Entries are (re)stamped with the write time under the rollup lock, so
+    the ledger stays in timestamp order across processes (_entries_since
+    bisects on it) and each entry counts toward the period it is written in.
+    """
+    budget = get_budget()
+    with _rollup_lock():
+        _stamp(entries)
+        _migrate_legacy_ledger()
+        # Bring the rollup up to date before appending so a rebuild can't
+        # count these entries twice.
+        rollup = _current_rollup(budget)
+        _append_entries(entries)
+        _update_rollup(rollup, entries)
+
+
+def log_usage(tool_name, cost, params=None, note=None):
+    """Record a tool call to the ledger."""
+    entry = _make_entry(tool_name, cost, params, note)
+    _record([entry])
+    return entry
+
+
+class LedgerSession:
+    """Buffer ledger entries in memory and write them in one append on exit.
+
+    For tools that make many paid calls in a burst:
+
+        with budget.LedgerSession() as session:
+            for query in queries:
+                allowed, *_ = session.check_budget(0.01)
+                ...
+                session.log_usage("exa", 0.01, params={"query": query})
+
+    Entries are flushed even if the block raises, since the calls were made.
+    They are timestamped when flushed, not when buffered.
+    """
+
+    def __init__(self):
+        self._buf = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+        return False
+
+    @property
+    def pending_cost(self):
+        return sum(e["cost"] for e in self._buf)
+
+    def check_budget(self, cost):
+        """check_budget() that also counts entries buffered in this session."""
+        return check_budget(cost, pending=self.pending_cost)
+
+    def log_usage(self, tool_name, cost, params=None, note=None):
+        """Buffer a tool call; it is written to the ledger on flush."""
+        entry = _make_entry(tool_name, cost, params, note)
+        self._buf.append(entry)
+        return entry
+
+    def flush(self):
+        if self._buf:
+            _record(self._buf)
+            self._buf = []
+
+
 def summary():
     """Return a human-readable budget summary."""
     budget = get_budget()
-    ledger = get_ledger()
-    spent = spend_in_period(budget, ledger)
+    rollup = get_rollup(budget)
+    spent = rollup["total"]
+    by_tool = rollup["by_tool"]
     limit = budget["limit"]
     period = budget["period"]
 
-    # Per-tool breakdown for current period
-    cutoff = _period_start(period).isoformat()
-    by_tool = {}
-    for entry in ledger["entries"]:
-        if entry["timestamp"] >= cutoff:
-            tool = entry["tool"]
-            by_tool[tool] = by_tool.get(tool, 0.0) + entry["cost"]
-
-    lines = [
-        f"Budget: ${limit:.2f} / {period}",
-        f"Spent:  ${spent:.3f} ({spent/limit*100:.1f}%)" if limit > 0 else f"Spent: ${spent:.3f}",
-        f"Remaining: ${limit - spent:.3f}",
-        "",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(f"Budget: ${limit:.2f} / {period}\n")
+    w(f"Spent:  ${spent:.3f} ({spent/limit*100:.1f}%)\n" if limit > 0 else f"Spent: ${spent:.3f}\n")
+    w(f"Remaining: ${limit - spent:.3f}\n\n")
     if by_tool:
-        lines.append("By tool:")
-        for tool, cost in sorted(by_tool.items(), key=lambda x: -x[1]):
-            lines.append(f"  {tool}: ${cost:.3f}")
+        w("By tool:")
+        for tool, cost in sorted(by_tool.items(), key=itemgetter(1), reverse=True):
+            w(f"\n  {tool}: ${cost:.3f}")
     else:
-        lines.append("No usage this period.")
+        w("No usage this period.")
 
-    return "\n".join(lines)
+    return buf.getvalue()
@@ -4,13 +4,26 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from lib import budget, registry
 
 
 def main():
     args = sys.argv[1:]
     cmd = args[0] if args else "summary"
 
+    # list-tools only needs the registry; everything else only needs budget.
+    if cmd == "list-tools":
+        from lib import registry
+
+        tools = registry.list_tools()
+        for t in tools:
+            cost = t.get("cost_per_call", 0)
+            cost_str = f"${cost:.3f}/call" if cost > 0 else "free"
+            desc = t.get("description", "")
+            print(f"  {t['name']:20s} {cost_str:>12s}  {desc}")
+        return
+
+    from lib import budget
+
     if cmd == "summary":
         print(budget.summary())
 
@@ -41,14 +54,6 @@ def main():
         budget._save_json(budget.BUDGET_FILE, b)
         print(f"Budget enforcement set to {args[1]} stop")
 
-    elif cmd == "list-tools":
-        tools = registry.list_tools()
-        for t in tools:
-            cost = t.get("cost_per_call", 0)
-            cost_str = f"${cost:.3f}/call" if cost > 0 else "free"
-            desc = t.get("description", "")
-            print(f"  {t['name']:20s} {cost_str:>12s}  {desc}")
-
     elif cmd == "ledger":
         ledger = budget.get_ledger()
         entries = ledger["entries"][-20:]
@@ -4,41 +4,157 @@ Tool registry. Discovers and loads tool definitions from ~/.aleph/tools/definiti
 Each tool definition is a Python module with:
   - meta: dict with name, description, cost_per_call (0 for free), params
   - execute(params: dict) -> str: the tool implementation
+
+Tool metadata is mirrored into ~/.aleph/.cache/tools-manifest.json (keyed by
+module name, stamped with the source mtime) so listing tools doesn't parse or
+import them. Entries are refreshed automatically whenever a definition file
+changes. The cache dir is gitignored, so the manifest never gets committed.
 """
 
+import ast
 import importlib
 import importlib.util
+import json
+import os
 import sys
 from pathlib import Path
 
 DEFINITIONS_DIR = Path.home() / ".aleph" / "tools" / "definitions"
+MANIFEST_FILE = Path.home() / ".aleph" / ".cache" / "tools-manifest.json"
+
+# Loaded modules keyed by path -> (mtime_ns, module). Reloaded when the file changes.
+_MOD_CACHE: dict[Path, tuple[int, object]] = {}
 
 
 def _load_module(name):
     """Import a tool definition module by name."""
     module_path = DEFINITIONS_DIR / f"{name}.py"
-    if not module_path.exists():
-        raise FileNotFoundError(f"No tool definition: {module_path}")
+    try:
+        mtime = module_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No tool definition: {module_path}") from None
+    cached = _MOD_CACHE.get(module_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     spec = importlib.util.spec_from_file_location(f"definitions.{name}", module_path)
     mod = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(mod)
+    _MOD_CACHE[module_path] = (mtime, mod)
     return mod
 
 
+def _read_meta(path):
+    """Extract a literal ``meta = {...}`` dict from source without importing it.
+
+    Returns None if there is no literal meta assignment (e.g. it is computed),
+    in which case callers fall back to importing the module.
+    """
+    try:
+        tree = ast.parse(path.read_text())
+    except (OSError, SyntaxError, ValueError):
+        return None
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id == "meta":
+                    try:
+                        return ast.literal_eval(node.value)
+                    except ValueError:
+                        return None
+    return None
+
+
+def _load_manifest():
+    try:
+        return json.loads(MANIFEST_FILE.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_manifest(manifest):
+    MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+    # Per-process temp name: concurrent rebuilds each rename a complete file
+    tmp = MANIFEST_FILE.with_name(f"{MANIFEST_FILE.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2) + "\n")
+    os.replace(tmp, MANIFEST_FILE)
+
+
+def register(name, meta, mtime_ns=None):
+    """Record a tool's meta in the manifest so listing doesn't need to load it."""
+    if mtime_ns is None:
+        mtime_ns = (DEFINITIONS_DIR / f"{name}.py").stat().st_mtime_ns
+    manifest = _load_manifest()
+    manifest[name] = {"mtime_ns": mtime_ns, "meta": meta}
+    _save_manifest(manifest)
+
+
 def get_tool(name):
     """Load and return a tool module by name."""
     return _load_module(name)
 
 
+def get_meta(name):
+    """Return a tool's meta dict without executing its module when possible.
+
+    Served from the manifest if the entry is current; otherwise the meta is
+    read from source (falling back to an import) and the manifest updated.
+    """
+    module_path = DEFINITIONS_DIR / f"{name}.py"
+    try:
+        mtime = module_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No tool definition: {module_path}") from None
+    entry = _load_manifest().get(name)
+    if entry is not None and entry.get("mtime_ns") == mtime:
+        return entry["meta"]
+    meta = _read_meta(module_path)
+    if not isinstance(meta, dict):
+        meta = _load_module(name).meta
+    try:
+        register(name, meta, mtime_ns=mtime)
+    except (OSError, TypeError):
+        pass  # manifest is only a cache
+    return meta
+
+
 def list_tools():
-    """List all available tool definitions with their metadata."""
+    """List all available tool definitions with their metadata.
+
+    Served from the manifest; only definitions whose mtime no longer matches
+    their manifest entry (or that have none) are re-read.
+    """
+    try:
+        with os.scandir(DEFINITIONS_DIR) as it:
+            files = [
+                e for e in it
+                if e.name.endswith(".py") and not e.name.startswith("_") and e.is_file()
+            ]
+    except FileNotFoundError:
+        files = []
+    files.sort(key=lambda e: e.name)
+
+    manifest = _load_manifest()
+    fresh = {}
     tools = []
-    for f in sorted(DEFINITIONS_DIR.glob("*.py")):
-        if f.name.startswith("_"):
-            continue
+    for f in files:
+        name = f.name[:-3]
+        mtime = f.stat().st_mtime_ns
+        entry = manifest.get(name)
+        if entry is None or entry.get("mtime_ns") != mtime:
+            meta = _read_meta(Path(f.path))
+            if not isinstance(meta, dict):
+                try:
+                    meta = _load_module(name).meta
+                except Exception as e:
+                    tools.append({"name": name, "error": str(e)})
+                    continue
+            entry = {"mtime_ns": mtime, "meta": meta}
+        fresh[name] = entry
+        tools.append(entry["meta"])
+
+    if fresh != manifest:
         try:
-            mod = _load_module(f.stem)
-            tools.append(mod.meta)
-        except Exception as e:
-            tools.append({"name": f.stem, "error": str(e)})
+            _save_manifest(fresh)
+        except (OSError, TypeError):
+            pass  # manifest is only a cache
     return tools
@@ -14,16 +14,21 @@ from pathlib import Path
 # Ensure the tools directory is importable
 sys.path.insert(0, str(Path.home() / ".aleph" / "tools"))
 
-# Load credentials from ~/.aleph/credentials/ (one file per key, filename = env var name)
-_creds_dir = Path.home() / ".aleph" / "credentials"
-if _creds_dir.is_dir():
-    for _f in _creds_dir.iterdir():
-        if _f.is_file() and not _f.name.startswith("."):
-            _key = _f.name
-            if _key not in os.environ:
-                os.environ[_key] = _f.read_text().strip()
-
-from lib import budget, registry
+# Load credentials from ~/.aleph/credentials/ (one file per key, filename = env var name).
+# Already-set keys are filtered by name first so their files are never stat'd or read.
+# ALEPH_ENV_LOADED marks the environment as populated, so tools spawned from a
+# tool (which inherit it) skip the directory scan entirely.
+if not os.environ.get("ALEPH_ENV_LOADED"):
+    _creds_dir = Path.home() / ".aleph" / "credentials"
+    if _creds_dir.is_dir():
+        os.environ.update({
+            _f.name: _f.read_text().strip()
+            for _f in _creds_dir.iterdir()
+            if _f.name not in os.environ and not _f.name.startswith(".") and _f.is_file()
+        })
+    os.environ["ALEPH_ENV_LOADED"] = "1"
+
+from lib import registry
 
 
 def parse_args(params_spec, argv):
@@ -37,39 +42,37 @@ def parse_args(params_spec, argv):
     Returns a dict of param_name -> value.
     """
     result = {}
-
-    # Check for flag-style args
-    if any(a.startswith("--") for a in argv):
-        i = 0
-        positional_idx = 0
-        while i < len(argv):
-            if argv[i].startswith("--"):
-                key = argv[i][2:].replace("-", "_")
-                if i + 1 < len(argv):
-                    result[key] = argv[i + 1]
-                    i += 2
-                else:
-                    result[key] = True
-                    i += 1
+    n = len(argv)
+    i = 0
+    positional_idx = 0
+    while i < n:
+        arg = argv[i]
+        if arg.startswith("--"):
+            key = arg[2:].replace("-", "_")
+            if i + 1 < n:
+                result[key] = argv[i + 1]
+                i += 2
             else:
-                # Positional arg mixed with flags
-                if positional_idx < len(params_spec):
-                    result[params_spec[positional_idx]["name"]] = argv[i]
-                    positional_idx += 1
+                result[key] = True
                 i += 1
-    else:
-        # Pure positional
-        for i, arg in enumerate(argv):
-            if i < len(params_spec):
-                result[params_spec[i]["name"]] = arg
+        else:
+            # Positional args map to params in order, with or without flags
+            if positional_idx < len(params_spec):
+                result[params_spec[positional_idx]["name"]] = arg
+                positional_idx += 1
+            i += 1
 
     return result
 
 
 def run(tool_name, argv):
-    """Load a tool, check budget, execute, log usage."""
+    """Load a tool, check budget, execute, log usage.
+
+    Arguments and budget are checked against the tool's meta before the tool
+    module itself is imported, so rejected calls never run its top-level code.
+    """
     try:
-        tool = registry.get_tool(tool_name)
+        meta = registry.get_meta(tool_name)
     except FileNotFoundError:
         print(f"Error: unknown tool '{tool_name}'", file=sys.stderr)
         print(f"Available tools:", file=sys.stderr)
@@ -77,7 +80,6 @@ def run(tool_name, argv):
             print(f"  {t['name']}: {t.get('description', '?')}", file=sys.stderr)
         sys.exit(1)
 
-    meta = tool.meta
     params_spec = meta.get("params", [])
     params = parse_args(params_spec, argv)
 
@@ -91,6 +93,8 @@ def run(tool_name, argv):
     # Budget check for paid tools
     cost = meta.get("cost_per_call", 0)
     if cost > 0:
+        from lib import budget
+
         allowed, spent, limit, msg = budget.check_budget(cost)
         if not allowed:
             print(f"BLOCKED: {msg}", file=sys.stderr)
@@ -100,6 +104,7 @@ def run(tool_name, argv):
 
     # Execute
     try:
+        tool = registry.get_tool(tool_name)
         result = tool.execute(params)
     except Exception as e:
         print(f"Error executing {tool_name}: {e}", file=sys.stderr)
@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 """Create the ~/.aleph/ directory structure and assemble the system prompt."""
 
+import hashlib
 import os
 import shutil
 import venv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 ALEPH_HOME = Path.home() / ".aleph"
 REPO_ROOT = Path(__file__).resolve().parent.parent
+# Rebuildable stamps and caches. ~/.aleph is often a git repo (commit_memory
+# commits it at session end), so this directory is gitignored.
+CACHE_DIR = ALEPH_HOME / ".cache"
 
 DIRS = [
     "tools",
@@ -18,21 +23,98 @@ DIRS = [
 ]
 
 
+def _tool_description_entries() -> list[os.DirEntry]:
+    """defaults/tools/*.md as DirEntry objects, sorted by name."""
+    try:
+        with os.scandir(REPO_ROOT / "defaults" / "tools") as it:
+            entries = [e for e in it if e.name.endswith(".md") and e.is_file()]
+    except FileNotFoundError:
+        return []
+    return sorted(entries, key=lambda e: e.name)
+
+
 def assemble_system_prompt() -> str:
     """Build the final system prompt by inserting tool descriptions into the template."""
     template = (REPO_ROOT / "defaults" / "ALEPH.md").read_text()
 
     # Gather tool descriptions from defaults/tools/ in sorted order
-    tools_dir = REPO_ROOT / "defaults" / "tools"
     tool_sections = []
-    if tools_dir.exists():
-        for tool_file in sorted(tools_dir.glob("*.md")):
-            tool_sections.append(tool_file.read_text().rstrip())
+    for entry in _tool_description_entries():
+        with open(entry.path) as f:
+            tool_sections.append(f.read().rstrip())
 
     tool_text = "\n\n".join(tool_sections) if tool_sections else "(No tool descriptions found.)"
     return template.replace("{{TOOL_DESCRIPTIONS}}", tool_text)
 
 
+def _prompt_stamp() -> str:
+    """Fingerprint the system prompt sources by path, mtime, and size."""
+    template = REPO_ROOT / "defaults" / "ALEPH.md"
+    sources = [(str(template), template.stat())]
+    sources += [(e.path, e.stat()) for e in _tool_description_entries()]
+    h = hashlib.blake2b(digest_size=16)
+    for path, st in sources:
+        h.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    return h.hexdigest()
+
+
+def _tree_stamp(root: Path) -> str:
+    """Fingerprint a directory tree by relative path, size, and mtime of each file.
+
+    Raises FileNotFoundError if root doesn't exist.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    stack = [("", os.fspath(root))]
+    while stack:
+        rel_dir, path = stack.pop()
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for e in entries:
+            rel = rel_dir + e.name
+            if e.is_dir(follow_symlinks=False):
+                stack.append((rel + "/", e.path))
+            else:
+                st = e.stat()
+                h.update(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
+
+def _copy_skill(skill_dir: Path, skills_dst: Path) -> str | None:
+    """Replace the installed copy of one skill if it differs from the source.
+
+    The stamp fingerprints both the source tree and the installed copy, so
+    a file edited or deleted on either side triggers a fresh copy. Returns
+    the skill name if it was copied, None if the stamp matched.
+    """
+    dst = skills_dst / skill_dir.name
+    stamp_file = CACHE_DIR / "skills" / f"{skill_dir.name}.stamp"
+    src_stamp = _tree_stamp(skill_dir)
+    try:
+        if stamp_file.read_text().strip() == f"{src_stamp} {_tree_stamp(dst)}":
+            return None
+    except FileNotFoundError:
+        pass
+    if dst.exists():
+        shutil.rmtree(dst)
+    shutil.copytree(skill_dir, dst)
+    stamp_file.write_text(f"{src_stamp} {_tree_stamp(dst)}\n")
+    return skill_dir.name
+
+
+def _ignore_cache_dir():
+    """Create CACHE_DIR and make sure ~/.aleph/.gitignore excludes it."""
+    (CACHE_DIR / "skills").mkdir(parents=True, exist_ok=True)
+    gitignore = ALEPH_HOME / ".gitignore"
+    try:
+        lines = gitignore.read_text().splitlines()
+    except FileNotFoundError:
+        lines = []
+    if ".cache/" not in lines:
+        lines.append(".cache/")
+        gitignore.write_text("\n".join(lines) + "\n")
+        print(f"  Added .cache/ to {gitignore}")
+
+
 def _create_bin_script(path, comment, module):
     """Create a tool bin/ wrapper script that invokes a lib/ module."""
     if path.exists():
@@ -58,6 +140,7 @@ def scaffold():
         path = ALEPH_HOME / d
         path.mkdir(parents=True, exist_ok=True)
         print(f"  Created {path}")
+    _ignore_cache_dir()
 
     # Symlink harness/ to the repo so edits are live and git works
     harness_link = ALEPH_HOME / "harness"
@@ -87,11 +170,23 @@ def scaffold():
         venv.create(venv_path, with_pip=True)
         print(f"  Created {venv_path}")
 
-    # Assemble and write system prompt (always overwrite)
+    # Assemble and write system prompt. The stamp records the sources and the
+    # written file's mtime, so we rebuild when either side changed.
     dst_prompt = ALEPH_HOME / "ALEPH.md"
-    prompt = assemble_system_prompt()
-    dst_prompt.write_text(prompt)
-    print(f"  Assembled {dst_prompt}")
+    stamp_file = CACHE_DIR / "ALEPH.md.stamp"
+    stamp = _prompt_stamp()
+    try:
+        current = f"{stamp} {dst_prompt.stat().st_mtime_ns}"
+        up_to_date = stamp_file.read_text().strip() == current
+    except FileNotFoundError:
+        up_to_date = False
+    if up_to_date:
+        print(f"  Skipped {dst_prompt} (sources unchanged)")
+    else:
+        prompt = assemble_system_prompt()
+        dst_prompt.write_text(prompt)
+        stamp_file.write_text(f"{stamp} {dst_prompt.stat().st_mtime_ns}\n")
+        print(f"  Assembled {dst_prompt}")
 
     # Create memory directory structure
     memory_dir = ALEPH_HOME / "memory"
@@ -173,13 +268,17 @@ def scaffold():
     skills_src = REPO_ROOT / "defaults" / "skills"
     skills_dst = ALEPH_HOME / "skills"
     if skills_src.exists():
-        for skill_dir in skills_src.iterdir():
-            if skill_dir.is_dir():
-                dst = skills_dst / skill_dir.name
-                if dst.exists():
-                    shutil.rmtree(dst)
-                shutil.copytree(skill_dir, dst)
-                print(f"  Copied skill: {skill_dir.name}")
+        # Each skill has its own destination directory, so copies can overlap
+        with os.scandir(skills_src) as it:
+            skill_dirs = [Path(e.path) for e in it if e.is_dir()]
+        if skill_dirs:
+            with ThreadPoolExecutor(max_workers=min(8, len(skill_dirs))) as ex:
+                copied = list(ex.map(lambda d: _copy_skill(d, skills_dst), skill_dirs))
+            for skill_dir, name in zip(skill_dirs, copied):
+                if name:
+                    print(f"  Copied skill: {name}")
+                else:
+                    print(f"  Skipped skill: {skill_dir.name} (unchanged)")
 
     print("\nDone. Run `aleph` to start a session.")
 
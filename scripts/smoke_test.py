@@ -4,6 +4,7 @@
 import asyncio
 
 import os
+import sys
 os.environ.pop("CLAUDECODE", None)
 
 from claude_agent_sdk import (
@@ -21,6 +22,13 @@ from aleph.config import AlephConfig
 from aleph.harness import AlephHarness, _discover_skills, _get_knowledge_cutoff
 
 
+def _write_text(text: str) -> None:
+    """Stream model text to stdout, flushing only at line boundaries."""
+    sys.stdout.write(text)
+    if "\n" in text:
+        sys.stdout.flush()
+
+
 async def main():
     config = AlephConfig(agent_id="smoke-test")
 
@@ -57,7 +65,7 @@ async def main():
         if isinstance(msg, AssistantMessage):
             for block in msg.content:
                 if isinstance(block, TextBlock):
-                    print(block.text, end="", flush=True)
+                    _write_text(block.text)
                 elif isinstance(block, ToolUseBlock):
                     print(f"\n[Tool: {block.name}({block.input})]", flush=True)
         elif isinstance(msg, UserMessage):
@@ -73,7 +81,7 @@ async def main():
             if event.get("type") == "content_block_delta":
                 delta = event.get("delta", {})
                 if delta.get("type") == "text_delta":
-                    print(delta.get("text", ""), end="", flush=True)
+                    _write_text(delta.get("text", ""))
 
     await client.disconnect()
 
@@ -1,21 +1,71 @@
 """Aleph CLI entry point."""
 
-import argparse
-import json
+from __future__ import annotations
+
+import functools
 import os
-import shlex
-import shutil
-import subprocess
 import sys
-from .config import ALEPH_HOME, AlephConfig
-from .harness import AlephHarness, _most_recent_agent_id, generate_agent_name
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
+
+# Same value as config.ALEPH_HOME, duplicated so --list and the tmux launch
+# path never import the config or harness modules.
+ALEPH_HOME = Path.home() / ".aleph"
 
 # Env var set inside the tmux session to prevent the inner aleph
 # from trying to create another tmux session (infinite recursion).
 _TMUX_GUARD = "ALEPH_IN_TMUX"
 
+# Sessions shown by --list unless --all is given
+_LIST_LIMIT = 50
+
+# --list status column, colored and padded to width once
+_STATUS_RUNNING = "\033[32mrunning\033[0m".ljust(20)
+_STATUS_DEAD = "\033[90mdead\033[0m".ljust(20)
+
+# Pre-rendered `aleph --help` output (80 columns), printed without building
+# the parser. Regenerate it when parse_args() changes.
+_STATIC_HELP = """\
+usage: aleph [-h] [--id ID] [--project PROJECT] [--model MODEL]
+             [--parent PARENT] [--prompt PROMPT] [--depth DEPTH] [--ephemeral]
+             [--continue] [--resume AGENT_ID] [--mode {safe,default,yolo}]
+             [--headless] [--detach] [--list] [--all]
+
+Aleph -- persistent self-improving agent harness
+
+options:
+  -h, --help            show this help message and exit
+  --id ID               Agent identifier (auto-generated if not provided)
+  --project PROJECT     Project directory (sets working directory)
+  --model MODEL         Model to use (e.g. claude-sonnet-4-5)
+  --parent PARENT       Parent agent ID (for spawned subagents)
+  --prompt PROMPT       Initial prompt (sent automatically on session start)
+  --depth DEPTH         Spawning depth (for recursion control)
+  --ephemeral           Ephemeral session: skip handoffs, session recaps, and
+                        exit summary
+  --continue            Continue the most recent session instead of starting
+                        fresh
+  --resume AGENT_ID     Resume a specific session by agent ID (e.g. aleph-
+                        frost-hawk)
+  --mode {safe,default,yolo}
+                        Initial permission mode (safe, default, yolo)
+  --headless            Run --prompt once without tmux or the TUI, print the
+                        reply, and exit (requires --mode yolo)
+  --detach              Don't attach to the tmux session after launch
+  --list                List known sessions from the registry with their
+                        status
+  --all                 With --list, show every session instead of the 50 most
+                        recent"""
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    import argparse
 
-def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="aleph",
         description="Aleph -- persistent self-improving agent harness",
@@ -68,6 +118,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Initial permission mode (safe, default, yolo)",
     )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run --prompt once without tmux or the TUI, print the reply, and exit "
+        "(requires --mode yolo)",
+    )
     parser.add_argument(
         "--detach",
         action="store_true",
@@ -78,36 +134,129 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="List known sessions from the registry with their status",
     )
-    return parser.parse_args()
-
-
-def _build_inner_command(args: argparse.Namespace, agent_id: str) -> str:
-    """Build the shell command that runs inside the tmux session."""
-    cmd_parts = [shutil.which("aleph") or "aleph", "--id", agent_id]
-    if args.project:
-        cmd_parts += ["--project", args.project]
-    if args.model:
-        cmd_parts += ["--model", args.model]
-    if args.parent:
-        cmd_parts += ["--parent", args.parent]
-    if args.prompt:
-        cmd_parts += ["--prompt", args.prompt]
-    if args.depth:
-        cmd_parts += ["--depth", str(args.depth)]
-    if args.ephemeral:
-        cmd_parts.append("--ephemeral")
-    if args.mode:
-        cmd_parts += ["--mode", args.mode]
-    if args.continue_session:
-        cmd_parts.append("--continue")
-    if args.resume:
-        cmd_parts += ["--resume", args.resume]
-    return shlex.join(cmd_parts)
-
-
-def _launch_in_tmux(args: argparse.Namespace) -> None:
-    """Launch aleph in a tmux session."""
-    if not shutil.which("tmux"):
+    parser.add_argument(
+        "--all",
+        dest="list_all",
+        action="store_true",
+        help=f"With --list, show every session instead of the {_LIST_LIMIT} most recent",
+    )
+    return parser
+
+
+# Options recognised by the argparse-free fast path: flag -> (dest, takes value).
+# Must mirror _get_parser().
+_FAST_FLAGS: dict[str, tuple[str, bool]] = {
+    "--id": ("id", True),
+    "--project": ("project", True),
+    "--model": ("model", True),
+    "--parent": ("parent", True),
+    "--prompt": ("prompt", True),
+    "--depth": ("depth", True),
+    "--ephemeral": ("ephemeral", False),
+    "--continue": ("continue_session", False),
+    "--resume": ("resume", True),
+    "--mode": ("mode", True),
+    "--headless": ("headless", False),
+    "--detach": ("detach", False),
+    "--list": ("list", False),
+    "--all": ("list_all", False),
+}
+_FAST_DEFAULTS = {dest: None if takes_value else False for dest, takes_value in _FAST_FLAGS.values()}
+_FAST_DEFAULTS["depth"] = 0
+_MODES = ("safe", "default", "yolo")
+
+
+def _parse_argv_fast(argv: list[str]) -> SimpleNamespace | None:
+    """Parse argv without argparse for the common well-formed case.
+
+    Returns None for anything it doesn't handle exactly like argparse
+    would (help, unknown or abbreviated flags, missing or dash-prefixed
+    values, bad --depth/--mode), so the caller can defer to the real parser
+    for its output and error messages.
+    """
+    ns = dict(_FAST_DEFAULTS)
+    i, n = 0, len(argv)
+    while i < n:
+        flag, eq, value = argv[i].partition("=")
+        spec = _FAST_FLAGS.get(flag)
+        if spec is None:
+            return None
+        dest, takes_value = spec
+        i += 1
+        if not takes_value:
+            if eq:
+                return None
+            ns[dest] = True
+            continue
+        if not eq:
+            if i == n or argv[i].startswith("-"):
+                return None
+            value = argv[i]
+            i += 1
+        if dest == "depth":
+            try:
+                value = int(value)
+            except ValueError:
+                return None
+        elif dest == "mode" and value not in _MODES:
+            return None
+        ns[dest] = value
+    return SimpleNamespace(**ns)
+
+
+def parse_args() -> argparse.Namespace | SimpleNamespace:
+    args = _parse_argv_fast(sys.argv[1:])
+    if args is None:
+        args = _get_parser().parse_args()
+    return args
+
+
+# Flags forwarded to the inner aleph: (args attribute, flag, store_true?).
+# Unset/falsy values are skipped, which also drops the default --depth 0.
+_PASSTHROUGH_FLAGS: tuple[tuple[str, str, bool], ...] = (
+    ("project", "--project", False),
+    ("model", "--model", False),
+    ("parent", "--parent", False),
+    ("prompt", "--prompt", False),
+    ("depth", "--depth", False),
+    ("ephemeral", "--ephemeral", True),
+    ("mode", "--mode", False),
+    ("continue_session", "--continue", True),
+    ("resume", "--resume", False),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _aleph_bin() -> str | None:
+    """Resolved path of the aleph executable on $PATH, looked up once."""
+    import shutil
+    return shutil.which("aleph")
+
+
+def _build_inner_argv(args: argparse.Namespace, agent_id: str) -> list[str]:
+    """Build the argv of the aleph process that runs inside the tmux session."""
+    cmd_parts = [_aleph_bin() or "aleph", "--id", agent_id]
+    for attr, flag, is_bool in _PASSTHROUGH_FLAGS:
+        value = getattr(args, attr, None)
+        if not value:
+            continue
+        cmd_parts.append(flag)
+        if not is_bool:
+            cmd_parts.append(str(value))
+    return cmd_parts
+
+
+def _launch_in_tmux(args: argparse.Namespace, in_tmux: bool) -> None:
+    """Launch aleph in a tmux session.
+
+    in_tmux says whether this process is already running under tmux.
+    """
+    import subprocess
+
+    from .names import generate_agent_name, most_recent_agent_id, tmux_bin as find_tmux
+
+    tmux_bin = find_tmux()
+    if not tmux_bin:
         import platform
         if platform.system() == "Darwin":
             hint = "brew install tmux"
@@ -117,14 +266,17 @@ def _launch_in_tmux(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     if args.continue_session and not args.id:
-        agent_id = _most_recent_agent_id(ALEPH_HOME) or generate_agent_name()
+        agent_id = most_recent_agent_id(ALEPH_HOME) or generate_agent_name()
     else:
         agent_id = args.resume or args.id or generate_agent_name()
-    inner_cmd = _build_inner_command(args, agent_id)
+    inner_argv = _build_inner_argv(args, agent_id)
 
-    # Create the session detached, with the guard env var set
+    # Create the session detached, with the guard env var set. Given more
+    # than one command argument, tmux execs them directly instead of going
+    # through `sh -c`, so nothing needs shell quoting.
     result = subprocess.run(
-        ["tmux", "new-session", "-d", "-s", agent_id, "-e", f"{_TMUX_GUARD}=1", inner_cmd],
+        [tmux_bin, "new-session", "-d", "-s", agent_id, "-e", f"{_TMUX_GUARD}=1",
+         "--", *inner_argv],
         capture_output=True, text=True,
     )
 
@@ -138,22 +290,34 @@ def _launch_in_tmux(args: argparse.Namespace) -> None:
         print(f"  tmux attach -t {agent_id}")
     else:
         # Attach to the session, replacing this process
-        if os.environ.get("TMUX"):
+        if in_tmux:
             # Already inside tmux — switch client to avoid nesting
-            os.execvp("tmux", ["tmux", "switch-client", "-t", agent_id])
+            os.execv(tmux_bin, ["tmux", "switch-client", "-t", agent_id])
         else:
-            os.execvp("tmux", ["tmux", "attach", "-t", agent_id])
+            os.execv(tmux_bin, ["tmux", "attach", "-t", agent_id])
+
 
+def _list_sessions(limit: int | None = _LIST_LIMIT) -> None:
+    """Print known sessions from the registry, most recent first.
+
+    Only the `limit` most recent are shown; None shows all of them.
+    """
+    import heapq
+    import json
+    import subprocess
+
+    try:
+        from orjson import loads
+    except ImportError:
+        loads = json.loads
 
-def _list_sessions() -> None:
-    """Print known sessions from the registry, most recent first."""
     registry_path = ALEPH_HOME / "logs" / "session-registry.json"
     if not registry_path.exists():
         print("No session registry found.")
         return
 
     try:
-        registry = json.loads(registry_path.read_text())
+        registry = loads(registry_path.read_bytes())
     except (json.JSONDecodeError, OSError) as e:
         print(f"Error reading registry: {e}")
         return
@@ -163,44 +327,82 @@ def _list_sessions() -> None:
         return
 
     # Get running tmux sessions for status check
-    running = set()
-    result = subprocess.run(
-        ["tmux", "list-sessions", "-F", "#{session_name}"],
-        capture_output=True, text=True,
-    )
-    if result.returncode == 0:
-        running = set(result.stdout.strip().splitlines())
+    from .names import tmux_bin as find_tmux
 
-    # Sort by started_at descending
-    entries = sorted(
-        registry.items(),
-        key=lambda kv: kv[1].get("started_at", ""),
-        reverse=True,
-    )
+    running: set[str] = set()
+    tmux_bin = find_tmux()
+    if tmux_bin:
+        try:
+            out = subprocess.check_output(
+                [tmux_bin, "list-sessions", "-F", "#{session_name}"],
+                text=True, stderr=subprocess.DEVNULL,
+            )
+            running = set(out.splitlines())
+        except (subprocess.CalledProcessError, OSError):
+            pass
 
-    for agent_id, info in entries:
-        status = "\033[32mrunning\033[0m" if agent_id in running else "\033[90mdead\033[0m"
-        started = info.get("started_at", "?")[:19]  # trim to seconds
-        model = info.get("model") or "default"
-        print(f"  {agent_id:<24} {status:<20} {started}  {model}")
+    # Most recent first. Registry order isn't start order (re-registered
+    # agents keep their slot), so select the top `limit` by started_at.
+    def started_at(kv):
+        return kv[1].get("started_at", "")
+
+    if limit is None or len(registry) <= limit:
+        entries = sorted(registry.items(), key=started_at, reverse=True)
+    else:
+        entries = heapq.nlargest(limit, registry.items(), key=started_at)
+
+    # One buffered write; started_at is trimmed to seconds
+    lines = [
+        f"  {agent_id:<24} {_STATUS_RUNNING if agent_id in running else _STATUS_DEAD} "
+        f"{info.get('started_at', '?')[:19]}  {info.get('model') or 'default'}\n"
+        for agent_id, info in entries
+    ]
+    hidden = len(registry) - len(entries)
+    if hidden:
+        lines.append(f"  ... {hidden} older session(s) not shown (use --all)\n")
+    sys.stdout.write("".join(lines))
 
 
 def main():
+    # Bare --help / --list skip argparse construction entirely. Anything
+    # more involved goes through the real parser.
+    argv = sys.argv[1:]
+    if argv in (["-h"], ["--help"]):
+        print(_STATIC_HELP)
+        return
+    if argv == ["--list"]:
+        _list_sessions()
+        return
+
     args = parse_args()
 
+    # The only environment the launcher consults, read once up front
+    env = os.environ
+    in_guard = env.get(_TMUX_GUARD)
+    in_tmux = bool(env.get("TMUX"))
+
     if args.list:
-        _list_sessions()
+        _list_sessions(None if args.list_all else _LIST_LIMIT)
         return
 
+    if args.headless and (not args.prompt or args.mode != "yolo"):
+        print("aleph: error: --headless requires --prompt and --mode yolo "
+              "(nobody is there to answer permission prompts)", file=sys.stderr)
+        sys.exit(2)
+
     # If we're not already inside our tmux session, launch through tmux.
     # Also bypass the guard when --detach is set — that means we're spawning
     # a peer agent and always want a new tmux session, even from inside one.
-    if not os.environ.get(_TMUX_GUARD) or args.detach:
-        _launch_in_tmux(args)
+    if (not in_guard or args.detach) and not args.headless:
+        _launch_in_tmux(args, in_tmux)
         return
 
+    from .config import AlephConfig
+    from .harness import AlephHarness
+    from .names import most_recent_agent_id
+
     if args.continue_session and not args.id:
-        resolved_id = _most_recent_agent_id(ALEPH_HOME)
+        resolved_id = most_recent_agent_id(ALEPH_HOME)
     else:
         resolved_id = args.resume or args.id
 
@@ -217,6 +419,13 @@ def main():
         initial_mode=args.mode,
     )
 
+    if args.headless:
+        # One-shot: no prompt_toolkit/TUI import at all
+        import asyncio
+        from .harness import run_oneshot
+
+        sys.exit(asyncio.run(run_oneshot(config)))
+
     harness = AlephHarness(config)
 
     from .tui import AlephApp
@@ -228,7 +437,7 @@ def main():
         # Replace this process with a fresh aleph invocation.
         # Clean shutdown (summary, archive, commit) already happened in app.run().
         # exec replaces the entire process image — clean slate, modules reloaded from disk.
-        aleph_bin = shutil.which("aleph") or sys.argv[0]
+        aleph_bin = _aleph_bin() or sys.argv[0]
         os.execvp(aleph_bin, [aleph_bin])
 
 
@@ -1,6 +1,7 @@
 """Configuration loading and defaults."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 
 ALEPH_HOME = Path.home() / ".aleph"
@@ -23,7 +24,9 @@ BASE_TOOLS = [
 ALLOWED_TOOLS = []
 
 
-@dataclass
+# Frozen: built once from CLI args and read-only for the rest of the session.
+# No slots, because cached_property needs the instance __dict__.
+@dataclass(frozen=True)
 class AlephConfig:
     """Harness configuration."""
 
@@ -57,36 +60,56 @@ class AlephConfig:
     # Initial permission mode (safe, default, yolo). None = default.
     initial_mode: str | None = None
 
-    @property
+    # (mtime_ns, text) of the last ALEPH.md read by load_system_prompt
+    _sys_prompt_cache: tuple[int, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Derived paths are cached on first access.
+    @cached_property
     def system_prompt_path(self) -> Path:
         return self.home / "ALEPH.md"
 
-    @property
+    @cached_property
     def memory_path(self) -> Path:
         return self.home / "memory"
 
-    @property
+    @cached_property
     def inbox_path(self) -> Path:
         return self.home / "inbox"
 
-    @property
+    @cached_property
     def tools_path(self) -> Path:
         return self.home / "tools"
 
-    @property
+    @cached_property
     def skills_path(self) -> Path:
         return self.home / "skills"
 
-    @property
+    @cached_property
     def scratch_path(self) -> Path:
         return self.home / "scratch"
 
+    @cached_property
+    def cache_path(self) -> Path:
+        return self.home / ".cache"
+
     def agent_inbox(self, agent_id: str) -> Path:
         return self.inbox_path / agent_id
 
     def load_system_prompt(self) -> str:
-        """Load the system prompt from ALEPH.md. Returns empty string if missing."""
+        """Load the system prompt from ALEPH.md. Returns empty string if missing.
+
+        Re-reads the file only when its mtime changed since the last call.
+        """
         path = self.system_prompt_path
-        if path.exists():
-            return path.read_text()
-        return ""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return ""
+        cached = self._sys_prompt_cache
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            return cached[1]
+        text = path.read_text()
+        object.__setattr__(self, "_sys_prompt_cache", (st.st_mtime_ns, text))
+        return text
@@ -1,70 +1,18 @@
 """Core harness — SDK integration and agent lifecycle."""
 
+import asyncio
+import functools
 import json
 import os
 
 # Allow launching from inside a Claude Code session (or another Aleph instance)
 os.environ.pop("CLAUDECODE", None)
-import platform
-import random
-import shutil
-import uuid
+import re
+import threading
 from datetime import date, datetime
 from pathlib import Path
 
-import yaml
-
-_ADJECTIVES = [
-    "amber", "ash", "black", "blue", "bold", "bright", "calm", "cold",
-    "coral", "crimson", "crystal", "dark", "dawn", "deep", "dusk", "ember",
-    "far", "first", "frost", "gold", "green", "grey", "high", "iron",
-    "jade", "keen", "last", "lone", "lost", "low", "moss", "new",
-    "old", "pale", "quiet", "red", "shadow", "silver", "still", "stone",
-    "storm", "sun", "swift", "thorn", "warm", "white", "wild",
-]
-
-_NOUNS = [
-    "bay", "bear", "blade", "brook", "cairn", "cliff", "cove", "crane",
-    "crow", "dale", "deer", "drake", "dune", "elk", "falcon", "fern",
-    "field", "forge", "fox", "gate", "glade", "glen", "grove", "hare",
-    "haven", "hawk", "heron", "isle", "jay", "keep", "lake", "lark",
-    "lynx", "marsh", "moth", "owl", "peak", "pike", "pine", "pond",
-    "raven", "reach", "reef", "ridge", "seal", "shore", "spire", "vale",
-    "vole", "ward", "wolf", "wren",
-]
-
-
-def generate_agent_name() -> str:
-    """Generate a human-readable agent name like 'aleph-frost-hawk'.
-
-    Checks running tmux sessions to avoid collisions with active agents.
-    Historical reuse is fine — date-stamped files (worklogs, summaries,
-    conversation archives) prevent data loss, and transient state (plans,
-    inbox, registry entries) is meant to be overwritten.
-
-    Falls back to hex UUID after 20 attempts.
-    """
-    import subprocess
-
-    # Get running tmux session names for collision check
-    running: set[str] = set()
-    try:
-        result = subprocess.run(
-            ["tmux", "list-sessions", "-F", "#{session_name}"],
-            capture_output=True, text=True, timeout=5,
-        )
-        if result.returncode == 0:
-            running = set(result.stdout.strip().splitlines())
-    except (OSError, subprocess.TimeoutExpired):
-        pass
-
-    for _ in range(20):
-        name = f"aleph-{random.choice(_ADJECTIVES)}-{random.choice(_NOUNS)}"
-        if name not in running:
-            return name
-    # Extremely unlikely fallback
-    return f"aleph-{uuid.uuid4().hex[:8]}"
-
+from .names import dump_registry, generate_agent_name, load_registry
 
 from claude_agent_sdk import (
     ClaudeAgentOptions,
@@ -72,18 +20,19 @@ from claude_agent_sdk import (
     HookMatcher,
 )
 
-# Alias → full model ID. Used to resolve shorthand names (including "default")
-# to the actual model string before building the system prompt.
-# Update when Claude Code changes its default or new model families are released.
+# Model used when none is given (or "default"), and shorthand family name →
+# full model ID. Used to resolve the actual model string before building the
+# system prompt. Update when Claude Code changes its default or new model
+# families are released.
+DEFAULT_MODEL = "claude-opus-4-6"
 MODEL_ALIASES = {
-    "default": "claude-opus-4-6",
     "opus": "claude-opus-4-6",
     "sonnet": "claude-sonnet-4-6",
     "haiku": "claude-haiku-4-5-20251001",
 }
 
-# Model ID prefix → knowledge cutoff date. Prefixes are matched in order,
-# so more specific prefixes should come first.
+# Model ID prefix → knowledge cutoff date. The longest matching prefix wins,
+# so entries can be listed in any order.
 KNOWLEDGE_CUTOFFS = {
     "claude-opus-4-6": "May 2025",
     "claude-opus-4-5": "May 2025",
@@ -96,6 +45,23 @@ KNOWLEDGE_CUTOFFS = {
     "claude-3-5": "Early 2024",
     "claude-3": "Early 2024",
 }
+_CUTOFF_ITEMS = tuple(sorted(KNOWLEDGE_CUTOFFS.items(), key=lambda kv: -len(kv[0])))
+# One capture group per prefix, longest first; group n maps to _CUTOFF_VALUES[n - 1]
+_CUTOFF_RE = re.compile("|".join(f"({re.escape(prefix)})" for prefix, _ in _CUTOFF_ITEMS))
+_CUTOFF_VALUES = tuple(cutoff for _, cutoff in _CUTOFF_ITEMS)
+
+
+def _scandir_entries(path) -> list[os.DirEntry]:
+    """Directory entries of path in readdir order; [] if it doesn't exist.
+
+    DirEntry caches the type from readdir, so is_dir() and the like cost no
+    extra stat per entry.
+    """
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
 
 
 def _discover_tools(tools_path) -> list[dict]:
@@ -107,60 +73,209 @@ def _discover_tools(tools_path) -> list[dict]:
     Managed tools: Python modules in tools_path/definitions/ with a ``meta`` dict
     containing ``name``, ``description``, and optionally ``cost_per_call``.
     """
-    tools = []
     if not tools_path.exists():
-        return tools
+        return []
 
     # --- Standalone scripts (top-level executable files with comment headers) ---
-    for path in sorted(tools_path.iterdir()):
-        if path.is_dir() or path.name.startswith("."):
-            continue
-        if not os.access(path, os.X_OK) and path.suffix != ".py":
-            continue
-        try:
-            text = path.read_text()
-        except Exception:
-            continue
-        # Look for # --- header block
-        header = _parse_tool_header(text)
-        if header and "name" in header:
-            tools.append({
-                "name": header["name"],
-                "description": header.get("description", ""),
-                "arguments": header.get("arguments", ""),
-            })
+    scripts = [
+        e for e in _scandir_entries(tools_path)
+        if not e.name.startswith(".") and not e.is_dir()
+        and (e.name.endswith(".py") or os.access(e.path, os.X_OK))
+    ]
 
     # --- Managed tools (definitions/*.py with meta dict) ---
-    defs_dir = tools_path / "definitions"
-    if defs_dir.exists():
-        for path in sorted(defs_dir.glob("*.py")):
-            if path.name.startswith("_"):
-                continue
-            try:
-                # Parse meta dict without importing the module (avoid side effects)
-                meta = _parse_meta_from_source(path)
-                if meta and "name" in meta:
-                    entry = {
-                        "name": meta["name"],
-                        "description": meta.get("description", ""),
-                    }
-                    cost = meta.get("cost_per_call", 0)
-                    if cost:
-                        entry["cost"] = cost
-                    tools.append(entry)
-            except Exception:
-                continue
+    definitions = [
+        e for e in _scandir_entries(tools_path / "definitions")
+        if e.name.endswith(".py") and not e.name.startswith("_")
+    ]
+
+    candidates = [(e, False) for e in scripts] + [(e, True) for e in definitions]
+    found = _map_io(_read_tool_entry, candidates)
+    # Sort only what survived filtering; a stable order keeps the prompt stable
+    return sorted((t for t in found if t is not None), key=_name_key)
+
+
+def _name_key(item: dict) -> str:
+    return str(item["name"])
+
+
+def _read_tool_entry(item) -> dict | None:
+    """Tool dict for one (DirEntry, is_definition) candidate, or None to skip it."""
+    entry, is_definition = item
+    try:
+        if not is_definition:
+            header = _cached_tool_header(entry.path, entry.stat().st_mtime_ns)
+            if header and "name" in header:
+                return {
+                    "name": header["name"],
+                    "description": header.get("description", ""),
+                    "arguments": header.get("arguments", ""),
+                }
+            return None
+        # Parse meta dict without importing the module (avoid side effects)
+        meta = _cached_meta(entry.path, entry.stat().st_mtime_ns)
+        if meta and "name" in meta:
+            tool = {
+                "name": meta["name"],
+                "description": meta.get("description", ""),
+            }
+            cost = meta.get("cost_per_call", 0)
+            if cost:
+                tool["cost"] = cost
+            return tool
+    except Exception:
+        pass
+    return None
+
+
+_IO_THREAD_PREFIX = "aleph-io"
+
+
+@functools.lru_cache(maxsize=1)
+def _io_pool():
+    """Thread pool shared by discovery and memory reads, created on first use
+    and reused by every start()."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix=_IO_THREAD_PREFIX)
+
+
+def _map_io(fn, items: list) -> list:
+    """map() for I/O-bound discovery work: runs on the shared pool when there
+    are several items, so file reads overlap. Results keep the input order.
 
-    return tools
+    On a pool thread (discovery submitted by _build_options) it runs inline,
+    since a worker blocking on tasks queued behind it could starve the pool.
+    """
+    if len(items) < 2 or threading.current_thread().name.startswith(_IO_THREAD_PREFIX):
+        return [fn(item) for item in items]
+    return list(_io_pool().map(fn, items))
+
+
+# Plain scalars YAML would resolve to something other than a string
+_YAML_NON_STR = frozenset(
+    "y Y yes Yes YES n N no No NO true True TRUE false False FALSE "
+    "on On ON off Off OFF null Null NULL ~ = <<".split()
+)
+_KEY_RE = re.compile(r"[A-Za-z_][\w-]*\Z")
+
+
+def _parse_simple_frontmatter(text: str) -> dict | None:
+    """Parse flat ``key: value`` frontmatter without YAML.
+
+    Handles the common shapes: one string scalar per line (plain or simply
+    quoted), and evenly indented ``>`` / ``|`` block scalars such as the
+    folded descriptions in SKILL.md. Returns None for anything YAML might
+    read differently (nesting, lists, escapes, comments, more-indented block
+    lines, non-string scalars) so the caller can fall back to the real loader.
+    """
+    result = {}
+    lines = text.splitlines()
+    i, n = 0, len(lines)
+    while i < n:
+        line = lines[i]
+        i += 1
+        if not line.strip():
+            continue
+        key, sep, value = line.partition(":")
+        if not sep or not _KEY_RE.match(key):
+            return None
+        if value and value[0] != " ":
+            return None
+        value = value.strip()
+        if not value:
+            return None
+        q = value[0]
+        if value in (">", ">-", "|", "|-"):
+            block = []
+            indent = None
+            while i < n:
+                raw = lines[i]
+                if not raw.strip():
+                    # Blank lines separate paragraphs; "" marks each one
+                    if indent is None or len(raw) > indent or "\t" in raw:
+                        return None
+                    block.append("")
+                elif raw[0] == " ":
+                    stripped = raw.lstrip(" ")
+                    if indent is None:
+                        indent = len(raw) - len(stripped)
+                    if (
+                        len(raw) - len(stripped) != indent
+                        or stripped[-1].isspace() or "\t" in stripped
+                    ):
+                        return None
+                    block.append(stripped)
+                    last = i
+                else:
+                    break
+                i += 1
+            while block and not block[-1]:
+                block.pop()
+            if not block:
+                return None
+            if q == "|":
+                joined = "\n".join(block)
+            else:
+                # Folding: adjacent lines join with a space, each blank line
+                # becomes a newline
+                folded = [block[0]]
+                for prev, cur in zip(block, block[1:]):
+                    if not cur:
+                        folded.append("\n")
+                    elif prev:
+                        folded.append(" " + cur)
+                    else:
+                        folded.append(cur)
+                joined = "".join(folded)
+            # Clip chomping keeps the final line break, if the text has one
+            if value.endswith("-") or (last == n - 1 and not text.endswith("\n")):
+                value = joined
+            else:
+                value = joined + "\n"
+        elif q == '"' or q == "'":
+            if len(value) < 2 or value[-1] != q or q in value[1:-1] or "\\" in value:
+                return None
+            value = value[1:-1]
+        elif (
+            q in "-?:,[]{}#&*!|>%@`.+" or q.isdigit()
+            or ": " in value or " #" in value or value.endswith(":")
+            or "\t" in value or value in _YAML_NON_STR
+        ):
+            return None
+        result[key] = value
+    return result or None
+
+
+def _yaml_load(text: str):
+    """Safe YAML load, used only when the simple parser gives up.
+
+    yaml is imported on first use so startup doesn't pay for it; the
+    libyaml-backed loader is used when available (same safe semantics).
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(text, Loader=loader)
+
+
+# How much of a standalone tool script is scanned for its ``# ---`` header
+_TOOL_HEADER_MAX_BYTES = 4096
+# A ``# ---`` delimiter line; a complete header has two
+_TOOL_HEADER_MARKER_RE = re.compile(rb"^[ \t]*# ---[ \t]*\r?$", re.MULTILINE)
 
 
 def _parse_tool_header(text: str) -> dict | None:
     """Extract YAML fields from a ``# ---`` comment header block."""
-    lines = text.split("\n")
     in_header = False
     header_lines = []
-    for line in lines:
-        stripped = line.strip()
+    i, n = 0, len(text)
+    while i < n:
+        j = text.find("\n", i)
+        if j == -1:
+            j = n
+        stripped = text[i:j].strip()
+        i = j + 1
         if stripped == "# ---":
             if in_header:
                 break  # closing delimiter
@@ -173,21 +288,37 @@ def _parse_tool_header(text: str) -> dict | None:
                 break  # non-comment line inside header = malformed, stop
     if not header_lines:
         return None
+    text = "\n".join(header_lines)
+    simple = _parse_simple_frontmatter(text)
+    if simple is not None:
+        return simple
     try:
-        return yaml.safe_load("\n".join(header_lines))
+        return _yaml_load(text)
     except Exception:
         return None
 
 
-def _parse_meta_from_source(path) -> dict | None:
-    """Extract a ``meta = {...}`` dict from a Python source file without importing it.
+# Top-level ``meta = {`` ... ``}`` with the closing brace alone at column 0
+_META_RE = re.compile(r"^meta\s*=\s*(\{.*?\n\})\s*$", re.MULTILINE | re.DOTALL)
+
+
+def _parse_meta_from_source(text: str) -> dict | None:
+    """Extract a ``meta = {...}`` dict from Python source text without importing it.
 
-    Uses ast to safely parse the assignment.
+    The literal is located with a regex and evaluated with ast.literal_eval;
+    only if that fails is the whole module parsed to find the assignment.
     """
     import ast
 
+    m = _META_RE.search(text)
+    if m:
+        try:
+            return ast.literal_eval(m.group(1))
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            pass
+
     try:
-        tree = ast.parse(path.read_text())
+        tree = ast.parse(text)
     except SyntaxError:
         return None
 
@@ -202,65 +333,217 @@ def _parse_meta_from_source(path) -> dict | None:
     return None
 
 
+# Per-file parse caches for discovery. Keyed by (path, mtime_ns) so an edited
+# file misses and is re-parsed; repeated harness construction in one process
+# (restarts, subagents, tests) only re-stats.
+
+@functools.lru_cache(maxsize=128)
+def _cached_tool_header(path: str, mtime_ns: int) -> dict | None:
+    # The header contract puts the block at the top of the file. If it hasn't
+    # closed within the first read, read the rest rather than truncate it.
+    with open(path, "rb") as f:
+        head = f.read(_TOOL_HEADER_MAX_BYTES)
+        if len(_TOOL_HEADER_MARKER_RE.findall(head)) < 2:
+            head += f.read()
+    return _parse_tool_header(head.decode("utf-8", errors="replace"))
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_meta(path: str, mtime_ns: int) -> dict | None:
+    raw = Path(path).read_bytes()
+    if b"meta" not in raw:
+        return None  # cheap early-out before any parsing
+    return _parse_meta_from_source(raw.decode())
+
+
+# Prefix of SKILL.md read when looking for the frontmatter
+_FRONTMATTER_MAX_BYTES = 8192
+
+
+def _read_frontmatter(path: str) -> dict | None:
+    """YAML frontmatter of a SKILL.md, or None if it has none.
+
+    Only the head of the file is read; if the frontmatter runs past it, the
+    read is extended a chunk at a time until the closing marker turns up.
+    """
+    # Raw fd reads: no buffered-file setup for what is usually one read
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, _FRONTMATTER_MAX_BYTES)
+        if not data.startswith(b"---"):
+            return None
+        end = data.find(b"---", 3)
+        while end == -1:
+            chunk = os.read(fd, _FRONTMATTER_MAX_BYTES)
+            if not chunk:
+                return None
+            # Back up two bytes in case the marker straddles the chunk boundary
+            start = max(3, len(data) - 2)
+            data += chunk
+            end = data.find(b"---", start)
+    finally:
+        os.close(fd)
+    text = data[3:end].decode()
+    simple = _parse_simple_frontmatter(text)
+    if simple is not None:
+        return simple
+    return _yaml_load(text)
+
+
+def _submit_memory_reads(memory_path: Path, names: list[str]) -> dict:
+    """Start reading whichever of the named files exist in memory_path.
+
+    One directory listing answers every "does it exist" question; each
+    read is its own task on the shared pool. Returns name -> Future[str].
+    """
+    wanted = set(names)
+    try:
+        with os.scandir(memory_path) as it:
+            found = [(e.name, e.path) for e in it if e.name in wanted and e.is_file()]
+    except FileNotFoundError:
+        return {}
+    pool = _io_pool()
+    return {name: pool.submit(Path(path).read_text) for name, path in found}
+
+
 def _discover_skills(skills_path) -> list[dict]:
     """Scan the skills directory and extract name + description from SKILL.md frontmatter."""
-    skills = []
-    if not skills_path.exists():
-        return skills
-    for skill_dir in sorted(skills_path.iterdir()):
-        skill_md = skill_dir / "SKILL.md"
-        if not skill_md.exists():
-            continue
-        text = skill_md.read_text()
-        if not text.startswith("---"):
-            continue
-        # Extract YAML frontmatter
+    return _skills_snapshot(skills_path)[0]
+
+
+def _skill_md_stamps(skill_dirs: list[str]) -> tuple:
+    """(skill_dir, SKILL.md mtime_ns, or None if it's missing) per skill directory."""
+    stamps = []
+    for skill_dir in skill_dirs:
         try:
-            end = text.index("---", 3)
-        except ValueError:
-            continue
-        frontmatter = yaml.safe_load(text[3:end])
-        if frontmatter and "name" in frontmatter:
-            skills.append({
-                "name": frontmatter["name"],
-                "description": frontmatter.get("description", "").strip(),
-                "path": str(skill_dir),
-            })
-    return skills
+            mtime = os.stat(os.path.join(skill_dir, "SKILL.md")).st_mtime_ns
+        except OSError:
+            mtime = None
+        stamps.append((skill_dir, mtime))
+    return tuple(stamps)
+
+
+def _read_skill_entry(stamp: tuple) -> dict | None:
+    """Skill dict for one (skill_dir, mtime) stamp, or None if it has no usable SKILL.md."""
+    skill_dir, mtime = stamp
+    if mtime is None:
+        return None
+    frontmatter = _read_frontmatter(os.path.join(skill_dir, "SKILL.md"))
+    if frontmatter and "name" in frontmatter:
+        return {
+            "name": frontmatter["name"],
+            "description": frontmatter.get("description", "").strip(),
+            "path": skill_dir,
+        }
+    return None
+
+
+# skills_path -> ((dir mtime_ns, SKILL.md stamps), discovered skills, formatted
+# prompt catalog), shared by every harness in the process. Adding or removing a
+# skill changes the directory's mtime; editing one changes its SKILL.md stamp.
+_SKILLS_SNAPSHOT: dict[str, tuple[tuple, list[dict], str]] = {}
+
 
+def _skills_snapshot(skills_path) -> tuple[list[dict], str]:
+    """Discovered skills and their catalog text.
 
+    A snapshot whose mtimes still match costs one stat per skill; otherwise
+    the directory is rescanned and every SKILL.md re-parsed.
+    """
+    key = os.fspath(skills_path)
+    try:
+        dir_mtime = os.stat(key).st_mtime_ns
+    except OSError:
+        return [], ""
+    cached = _SKILLS_SNAPSHOT.get(key)
+    if cached is not None and cached[0][0] == dir_mtime:
+        skill_dirs = [skill_dir for skill_dir, _ in cached[0][1]]
+    else:
+        skill_dirs = [e.path for e in _scandir_entries(key) if e.is_dir()]
+    stamps = _skill_md_stamps(skill_dirs)
+    if cached is not None and cached[0] == (dir_mtime, stamps):
+        return cached[1], cached[2]
+    found = _map_io(_read_skill_entry, list(stamps))
+    skills = sorted((s for s in found if s is not None), key=_name_key)
+    catalog = _format_skill_catalog(skills)
+    _SKILLS_SNAPSHOT[key] = ((dir_mtime, stamps), skills, catalog)
+    return skills, catalog
+
+
+def _format_skill_catalog(skills: list[dict]) -> str:
+    """The "Available skills" block of the session context ("" if none)."""
+    if not skills:
+        return ""
+    lines = ["\nAvailable skills:\n"]
+    for s in skills:
+        lines.append(f"- **{s['name']}** ({s['path']}): {s['description']}\n")
+    lines.append("\nUse `activate_skill` to load a skill before using it.\n")
+    return "".join(lines)
+
+
+@functools.lru_cache(maxsize=64)
 def _resolve_model(model: str | None) -> str:
-    """Resolve a model name through aliases, falling back to the default alias."""
-    if model is None:
-        model = "default"
+    """Resolve a model name through aliases; None or "default" means DEFAULT_MODEL."""
+    if model is None or model == "default":
+        return DEFAULT_MODEL
     return MODEL_ALIASES.get(model, model)
 
 
+@functools.lru_cache(maxsize=64)
 def _get_knowledge_cutoff(model: str) -> str:
     """Look up the knowledge cutoff for a model string by prefix match."""
-    for prefix, cutoff in KNOWLEDGE_CUTOFFS.items():
-        if model.startswith(prefix):
-            return cutoff
-    return "unknown"
+    m = _CUTOFF_RE.match(model)
+    return _CUTOFF_VALUES[m.lastindex - 1] if m else "unknown"
 
 
-def _most_recent_agent_id(home: Path) -> str | None:
-    """Look up the most recently started agent ID from the session registry.
+@functools.lru_cache(maxsize=16)
+def _context_header(model: str) -> str:
+    """Session Context heading plus the model, cutoff, platform and shell lines.
 
-    Used by --continue to reuse the same agent ID instead of generating a new one.
-    Returns None if the registry doesn't exist or is empty.
+    Fixed for a given model over the life of the process.
     """
-    registry_path = home / "logs" / "session-registry.json"
-    if not registry_path.exists():
-        return None
-    try:
-        registry = json.loads(registry_path.read_text())
-    except (json.JSONDecodeError, OSError):
-        return None
-    if not registry:
-        return None
-    # Sort by started_at descending, return the most recent
-    return max(registry, key=lambda k: registry[k].get("started_at", ""))
+    import platform
+
+    cutoff = _get_knowledge_cutoff(model)
+    if cutoff == "unknown":
+        cutoff_line = (
+            f"Knowledge cutoff: **UNKNOWN — the model '{model}' doesn't match any "
+            f"prefix in KNOWLEDGE_CUTOFFS. Update harness.py if a new model generation "
+            f"has been released.**\n"
+        )
+    else:
+        cutoff_line = f"Knowledge cutoff: {cutoff}\n"
+    return (
+        "\n\n---\n## Session Context\n\n"
+        f"Model: {model}\n"
+        f"{cutoff_line}"
+        f"Platform: {platform.system()} {platform.release()}\n"
+        f"Shell: {os.environ.get('SHELL', 'unknown')}\n"
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _date_fragment(today: date) -> str:
+    """Today's-date line, keyed by date so it rolls over at midnight."""
+    return f"\nToday's date is **{today.strftime('%B %d, %Y')}**."
+
+
+@functools.lru_cache(maxsize=8)
+def _compute_env(home: Path, agent_id: str) -> dict[str, str]:
+    """Subprocess env for an agent. Shared across calls — copy before mutating."""
+    # Disable Claude Code's auto-memory + pre-activate canonical venv
+    venv_path = home / "venv"
+    env = {
+        "CLAUDE_CODE_DISABLE_AUTO_MEMORY": "1",
+        "CLAUDE_CODE_DISABLE_FILE_CHECKPOINTING": "1",
+        "ALEPH_HOME": str(home),
+        "ALEPH_AGENT_ID": agent_id,
+    }
+    if venv_path.exists():
+        venv_bin = venv_path / "bin"
+        env["VIRTUAL_ENV"] = str(venv_path)
+        env["PATH"] = f"{venv_bin}:{os.environ.get('PATH', '')}"
+    return env
 
 
 from .config import ALLOWED_TOOLS, BASE_TOOLS, AlephConfig
@@ -278,6 +561,50 @@ from .hooks import (
 from .tools import FileState, SessionControl, create_aleph_mcp_server
 
 
+def _copy_file(src: Path, dst: Path) -> None:
+    """shutil.copy2, but with os.copy_file_range where the platform has it.
+
+    copy_file_range copies inside the kernel and lets copy-on-write
+    filesystems (btrfs, XFS) share extents instead of duplicating data.
+    """
+    import shutil
+
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            infd, outfd = fsrc.fileno(), fdst.fileno()
+            while os.copy_file_range(infd, outfd, 1 << 30):
+                pass
+    except (AttributeError, OSError):
+        shutil.copy2(src, dst)
+        return
+    shutil.copystat(src, dst)
+
+
+def _commit_all_pygit2(pygit2, repo_path: Path, msg: str) -> str | None:
+    """Stage everything and commit, like ``git add -A && git commit -m msg``.
+
+    Returns a ``git commit``-style summary line, or None if nothing changed.
+    """
+    repo = pygit2.Repository(str(repo_path))
+    index = repo.index
+    index.add_all()
+    tree = index.write_tree()
+    if repo.head_is_unborn:
+        parents = []
+    else:
+        head = repo.head.peel(pygit2.Commit)
+        if head.tree_id == tree:
+            return None  # nothing to commit
+        parents = [head.id]
+    index.write()
+    sig = repo.default_signature
+    oid = repo.create_commit("HEAD", sig, sig, msg, tree, parents)
+    ref = "HEAD" if repo.head_is_detached else repo.head.shorthand
+    if not parents:
+        ref += " (root-commit)"
+    return f"[{ref} {str(oid)[:7]}] {msg}"
+
+
 class AlephHarness:
     """Manages a single Aleph agent session."""
 
@@ -290,6 +617,7 @@ class AlephHarness:
         self._model_verified = False
         self._permission_hook = None
         self._shell_cleanup = None
+        self._static_opts: tuple[list[str], list[str], dict[str, str]] | None = None
         self._stderr_log: Path | None = None
         self.session_control: SessionControl | None = None
         self._stderr_fh = None
@@ -335,21 +663,29 @@ class AlephHarness:
         Called as soon as the session UUID is captured from ResultMessage,
         so the mapping survives crashes. Uses file locking to prevent
         concurrent agents from clobbering each other's writes.
+
+        The new registry is written to a temp file and renamed over the old
+        one, so readers never see a half-written file. The lock lives on a
+        separate .lock file because the rename replaces the registry's inode.
+        Both sidecars go in the cache dir so commit_memory never picks them up.
         """
         import fcntl
 
         if not self.session_id:
             return
 
-        self._registry_path.parent.mkdir(parents=True, exist_ok=True)
+        path = self._registry_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        cache = self.config.cache_path
+        cache.mkdir(parents=True, exist_ok=True)
+        tmp = cache / (path.name + ".tmp")
 
         try:
-            with open(self._registry_path, "a+") as f:
-                fcntl.flock(f, fcntl.LOCK_EX)
-                f.seek(0)
+            with open(cache / (path.name + ".lock"), "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
                 try:
-                    registry = json.loads(f.read() or "{}")
-                except json.JSONDecodeError:
+                    registry = load_registry(path.read_bytes() or b"{}")
+                except (FileNotFoundError, json.JSONDecodeError):
                     registry = {}
 
                 registry[self.agent_id] = {
@@ -359,9 +695,8 @@ class AlephHarness:
                     "started_at": datetime.now().isoformat(),
                 }
 
-                f.seek(0)
-                f.truncate()
-                f.write(json.dumps(registry, indent=2) + "\n")
+                tmp.write_bytes(dump_registry(registry))
+                os.replace(tmp, path)
         except OSError:
             pass
 
@@ -376,7 +711,7 @@ class AlephHarness:
         if not registry_path.exists():
             return None
         try:
-            registry = json.loads(registry_path.read_text())
+            registry = load_registry(registry_path.read_bytes())
             return registry.get(agent_id)
         except (json.JSONDecodeError, OSError):
             return None
@@ -391,109 +726,116 @@ class AlephHarness:
 
     def _build_options(self) -> ClaudeAgentOptions:
         """Build ClaudeAgentOptions from config."""
+        # Tool discovery, skill discovery, the memory file reads and the session
+        # recap are independent I/O; start them now and collect the results
+        # where needed. Recap and handoff are skipped in ephemeral mode and on
+        # --continue/--resume, as are knowledge index and volatile memory for
+        # ephemeral agents (see below).
+        is_resuming = self.config.continue_session or self.config.resume_session
+        want_recap = not self.config.ephemeral and not is_resuming
+        memory_names = ["core.md"]
+        if not self.config.ephemeral:
+            memory_names += ["knowledge-index.md", "volatile.md"]
+        if want_recap:
+            memory_names.append("handoff.md")
+        pool = _io_pool()
+        tools_future = pool.submit(_discover_tools, self.config.tools_path)
+        skills_future = pool.submit(_skills_snapshot, self.config.skills_path)
+        recap_future = (
+            pool.submit(_build_session_recap, self.config.memory_path / "sessions")
+            if want_recap else None
+        )
+        memory_futures = _submit_memory_reads(self.config.memory_path, memory_names)
+
         system_prompt = self.config.load_system_prompt()
 
         # Append dynamic session context
-        model = _resolve_model(self.config.model)
-        cutoff = _get_knowledge_cutoff(model)
+        model = self._expected_model
         cwd = self.config.project or os.getcwd()
 
-        ctx = "\n\n---\n## Session Context\n\n"
-        ctx += f"Agent ID: {self.agent_id}\n"
-        ctx += f"Inbox: {self.config.agent_inbox(self.agent_id)}\n"
-        if self.config.parent:
-            ctx += f"Parent: {self.config.parent}\n"
-            ctx += f"Depth: {self.config.depth}\n"
-
-        ctx += f"\nModel: {model}\n"
-        if cutoff == "unknown":
-            ctx += (
-                f"Knowledge cutoff: **UNKNOWN — the model '{model}' doesn't match any "
-                f"prefix in KNOWLEDGE_CUTOFFS. Update harness.py if a new model generation "
-                f"has been released.**\n"
-            )
-        else:
-            ctx += f"Knowledge cutoff: {cutoff}\n"
-        ctx += f"Platform: {platform.system()} {platform.release()}\n"
-        ctx += f"Shell: {os.environ.get('SHELL', 'unknown')}\n"
-        ctx += f"Working directory: {cwd}\n"
+        # Accumulate fragments and join once at the end. Lines shared by every
+        # agent on this install (model, platform, tools, skills) come first and
+        # per-agent ones (ID, inbox, cwd, date) after, so the start of the
+        # prompt stays byte-identical across sessions for prefix caching.
+        parts = [_context_header(model)]
+        add = parts.append
 
         # Discover custom tools
-        custom_tools = _discover_tools(self.config.tools_path)
+        custom_tools = tools_future.result()
         if custom_tools:
-            ctx += "\nCustom tools (invoke via Bash):\n"
+            add("\nCustom tools (invoke via Bash):\n")
             for t in custom_tools:
                 cost_tag = f" **[${t['cost']}/call]**" if t.get("cost") else ""
                 args = f" `{t['arguments']}`" if t.get("arguments") else ""
-                ctx += f"- **{t['name']}**{args} — {t['description']}{cost_tag}\n"
+                add(f"- **{t['name']}**{args} — {t['description']}{cost_tag}\n")
 
-        # Discover available skills
-        skills = _discover_skills(self.config.skills_path)
-        if skills:
-            ctx += "\nAvailable skills:\n"
-            for s in skills:
-                ctx += f"- **{s['name']}** ({s['path']}): {s['description']}\n"
-            ctx += "\nUse `activate_skill` to load a skill before using it.\n"
+        # Available skills (catalog text is formatted once per snapshot)
+        _, skills_catalog = skills_future.result()
+        add(skills_catalog)
 
-        ctx += f"\nToday's date is **{date.today().strftime('%B %d, %Y')}**."
+        add(f"\nAgent ID: {self.agent_id}\n")
+        add(f"Inbox: {self.config.agent_inbox(self.agent_id)}\n")
+        if self.config.parent:
+            add(f"Parent: {self.config.parent}\nDepth: {self.config.depth}\n")
+        add(f"Working directory: {cwd}\n")
+        add(_date_fragment(date.today()))
+
+        memory = {name: f.result() for name, f in memory_futures.items()}
 
         # Inject memory context (hot tier) if it exists
-        context_file = self.config.memory_path / "core.md"
-        if context_file.exists():
-            ctx += "\n\n---\n## Memory Context\n\n"
-            ctx += context_file.read_text()
+        context_text = memory.get("core.md")
+        if context_text is not None:
+            add("\n\n---\n## Memory Context\n\n")
+            add(context_text)
 
         # Inject knowledge base index if it exists
-        kb_index_file = self.config.memory_path / "knowledge-index.md"
-        if kb_index_file.exists() and not self.config.ephemeral:
-            ctx += "\n\n---\n"
-            ctx += kb_index_file.read_text()
+        kb_index_text = memory.get("knowledge-index.md")
+        if kb_index_text is not None:
+            add("\n\n---\n")
+            add(kb_index_text)
 
         # Inject volatile state-of-mind if it exists (skip for ephemeral agents —
         # volatile is the persistent agent's state of mind, not relevant to workers)
-        volatile_file = self.config.memory_path / "volatile.md"
-        if volatile_file.exists() and not self.config.ephemeral:
-            ctx += "\n\n---\n## Volatile Memory\n\n"
-            ctx += volatile_file.read_text()
+        volatile_text = memory.get("volatile.md")
+        if volatile_text is not None:
+            add("\n\n---\n## Volatile Memory\n\n")
+            add(volatile_text)
 
         # Inject handoff and session recap (skip in ephemeral mode).
         # On --continue, skip both: the conversation history already has whatever
         # context the original session had, and handoff consumption is destructive
         # (we'd eat a file meant for a future fresh session).
-        handoff_file = self.config.memory_path / "handoff.md"
-        sessions_path = self.config.memory_path / "sessions"
         handoff_content = None
         recap_content = None
 
-        is_resuming = self.config.continue_session or self.config.resume_session
-        if not self.config.ephemeral and not is_resuming:
-            if handoff_file.exists():
-                handoff_content = handoff_file.read_text()
-                handoff_file.unlink()
+        if want_recap:
+            handoff_content = memory.get("handoff.md")
+            if handoff_content is not None:
+                (self.config.memory_path / "handoff.md").unlink()
 
-            recap_content = _build_session_recap(sessions_path)
+            recap_content = recap_future.result()
 
         if handoff_content or recap_content:
-            ctx += "\n\n---\n## Session Continuity\n\n"
-            ctx += (
+            add(
+                "\n\n---\n## Session Continuity\n\n"
                 "The following is context carried forward from previous sessions. "
                 "Use it to orient yourself — what was recently worked on, what state "
                 "things are in, and anything left unfinished.\n\n"
             )
             if handoff_content:
-                ctx += "### Handoff\n\n"
-                ctx += handoff_content
-                ctx += "\n\n"
+                add("### Handoff\n\n")
+                add(handoff_content)
+                add("\n\n")
             if recap_content:
-                ctx += "### Recent Sessions (today)\n\n"
-                ctx += recap_content
-                ctx += "\n"
+                add("### Recent Sessions (today)\n\n")
+                add(recap_content)
+                add("\n")
 
-        full_prompt = system_prompt + ctx
+        full_prompt = system_prompt + "".join(parts)
 
-        # Set up inbox directory
+        # Tool lists + env (and the inbox/log dirs) are computed once per harness
+        tools, allowed, env = self._static_options()
         inbox = self.config.agent_inbox(self.agent_id)
-        inbox.mkdir(parents=True, exist_ok=True)
 
         # Shared file state for MCP Edit/Write ↔ Read hook coordination
         file_state = FileState()
@@ -542,25 +884,6 @@ class AlephHarness:
                 HookMatcher(matcher=None, hooks=[self._permission_hook]),
             ]
 
-        # tools controls which tool schemas the model sees (--tools flag).
-        # allowed_tools is an additional execution-level whitelist (--allowedTools).
-        # When ALLOWED_TOOLS is empty, all BASE_TOOLS are callable.
-        tools = list(BASE_TOOLS)
-        allowed = list(ALLOWED_TOOLS) + ["mcp__aleph__message"] if ALLOWED_TOOLS else []
-
-        # Environment: disable Claude Code's auto-memory + pre-activate canonical venv
-        venv_path = self.config.home / "venv"
-        env = {
-            "CLAUDE_CODE_DISABLE_AUTO_MEMORY": "1",
-            "CLAUDE_CODE_DISABLE_FILE_CHECKPOINTING": "1",
-            "ALEPH_HOME": str(self.config.home),
-            "ALEPH_AGENT_ID": self.agent_id,
-        }
-        if venv_path.exists():
-            venv_bin = venv_path / "bin"
-            env["VIRTUAL_ENV"] = str(venv_path)
-            env["PATH"] = f"{venv_bin}:{os.environ.get('PATH', '')}"
-
         # Build MCP server for framework tools (needs cwd + env + file_state)
         aleph_server, self._shell_cleanup = create_aleph_mcp_server(
             self.config.inbox_path, self.config.skills_path,
@@ -590,14 +913,19 @@ class AlephHarness:
 
         # Set up stderr logging — captures Claude CLI error output to a file
         # so we can diagnose crashes after the fact.
-        log_dir = self.config.home / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
-        self._stderr_log = log_dir / f"stderr-{self.agent_id}.log"
-        self._stderr_fh = open(self._stderr_log, "a")
+        self._stderr_log = self.config.home / "logs" / f"stderr-{self.agent_id}.log"
+        # Line-buffered: one write per line without an explicit flush.
+        # ALEPH_STDERR_SYNC=1 additionally fsyncs each line for crash forensics.
+        self._stderr_fh = open(self._stderr_log, "a", buffering=1)
+        stderr_sync = bool(os.environ.get("ALEPH_STDERR_SYNC"))
 
         def _stderr_callback(line: str) -> None:
+            # The SDK strips line endings; restore them so line buffering flushes
+            if not line.endswith("\n"):
+                line += "\n"
             self._stderr_fh.write(line)
-            self._stderr_fh.flush()
+            if stderr_sync:
+                os.fsync(self._stderr_fh.fileno())
 
         return ClaudeAgentOptions(
             system_prompt=full_prompt,
@@ -615,9 +943,36 @@ class AlephHarness:
             stderr=_stderr_callback,
         )
 
+    def _static_options(self) -> tuple[list[str], list[str], dict[str, str]]:
+        """Tool lists and subprocess env, which are fixed for this harness.
+
+        Computed (and the inbox/log directories created) on first use, then
+        reused by later _build_options calls. Hooks and the MCP server are
+        rebuilt each time: they carry per-session state (SessionControl, the
+        persistent shell that stop() tears down). Copies are returned so
+        callers can adjust their options freely.
+        """
+        if self._static_opts is None:
+            self.config.agent_inbox(self.agent_id).mkdir(parents=True, exist_ok=True)
+            (self.config.home / "logs").mkdir(parents=True, exist_ok=True)
+
+            # tools controls which tool schemas the model sees (--tools flag).
+            # allowed_tools is an additional execution-level whitelist (--allowedTools).
+            # When ALLOWED_TOOLS is empty, all BASE_TOOLS are callable.
+            tools = list(BASE_TOOLS)
+            allowed = list(ALLOWED_TOOLS) + ["mcp__aleph__message"] if ALLOWED_TOOLS else []
+
+            env = _compute_env(self.config.home, self.agent_id)
+
+            self._static_opts = (tools, allowed, env)
+        tools, allowed, env = self._static_opts
+        return list(tools), list(allowed), dict(env)
+
     async def start(self):
         """Start the agent session."""
-        options = self._build_options()
+        # Building options is blocking file I/O (prompt, discovery, memory);
+        # run it off the event loop so the UI stays responsive meanwhile.
+        options = await asyncio.to_thread(self._build_options)
         self._client = ClaudeSDKClient(options)
         await self._client.connect()
 
@@ -651,7 +1006,7 @@ class AlephHarness:
         warning = (
             f"Model mismatch: expected '{self._expected_model}' "
             f"but got '{actual_model}'. "
-            f"Update MODEL_ALIASES in harness.py."
+            f"Update DEFAULT_MODEL/MODEL_ALIASES in harness.py."
         )
 
         # Check if the cutoff table covers this model
@@ -749,6 +1104,20 @@ class AlephHarness:
         if not (repo / ".git").exists():
             return None
 
+        msg = f"Session end: {self.agent_id}"
+
+        # In-process commit via libgit2 when available; the git CLI below is
+        # the fallback (and handles lock contention with retries).
+        try:
+            import pygit2
+        except ImportError:
+            pygit2 = None
+        if pygit2 is not None:
+            try:
+                return _commit_all_pygit2(pygit2, repo, msg)
+            except (pygit2.GitError, KeyError, OSError):
+                pass
+
         max_retries = 5
         for attempt in range(max_retries):
             try:
@@ -756,15 +1125,8 @@ class AlephHarness:
                     ["git", "add", "-A"],
                     cwd=repo, capture_output=True, timeout=10,
                 )
-                # Check if there's anything to commit
-                result = subprocess.run(
-                    ["git", "diff", "--cached", "--quiet"],
-                    cwd=repo, capture_output=True, timeout=10,
-                )
-                if result.returncode == 0:
-                    return None  # nothing to commit
-
-                msg = f"Session end: {self.agent_id}"
+                # No separate "anything staged?" check: commit exits non-zero
+                # when there is nothing to commit, handled like other failures.
                 result = subprocess.run(
                     ["git", "commit", "-m", msg],
                     cwd=repo, capture_output=True, text=True, timeout=10,
@@ -776,10 +1138,10 @@ class AlephHarness:
                     # Might be lock contention
                     if (repo / ".git" / "index.lock").exists():
                         raise FileExistsError("index.lock")
-                    return None
+                    return None  # nothing to commit, or a real error
             except (FileExistsError, subprocess.TimeoutExpired):
                 if attempt < max_retries - 1:
-                    time.sleep(1 * (2 ** attempt))  # exponential backoff
+                    time.sleep(0.05 * (2 ** attempt))  # exponential backoff
                 continue
             except Exception:
                 return None
@@ -808,7 +1170,7 @@ class AlephHarness:
 
         today = date.today().strftime("%Y-%m-%d")
         dest = dest_dir / f"{today}-{self.agent_id}.jsonl"
-        shutil.copy2(source, dest)
+        _copy_file(source, dest)
         return str(dest)
 
     async def stop(self):
@@ -836,3 +1198,48 @@ class AlephHarness:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.stop()
         return False
+
+
+async def run_oneshot(config: AlephConfig) -> int:
+    """Run a single prompt without the TUI and print the reply to stdout.
+
+    Used by `aleph --headless`. There is no one to answer permission prompts,
+    so no permission hook is installed. The session-end protocol matches the
+    TUI's. Returns a process exit code.
+    """
+    import sys
+
+    from claude_agent_sdk import AssistantMessage, ResultMessage, TextBlock
+
+    harness = AlephHarness(config)
+    exit_code = 0
+    async with harness:
+        await harness.send(config.prompt)
+        async for msg in harness.receive():
+            if isinstance(msg, AssistantMessage):
+                for block in msg.content:
+                    if isinstance(block, TextBlock) and block.text:
+                        sys.stdout.write(block.text)
+            elif isinstance(msg, ResultMessage):
+                if msg.session_id and not harness.session_id:
+                    harness.session_id = msg.session_id
+                    harness.register_session()
+                if msg.is_error:
+                    exit_code = 1
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+        sc = harness.session_control
+        if not (config.ephemeral or (sc and sc.skip_summary)):
+            # Like the TUI, a failed summary shouldn't skip the archive/commit
+            try:
+                for prompt in harness.get_session_end_prompts():
+                    await harness.send(prompt)
+                    async for _ in harness.receive():
+                        pass
+            except Exception as e:
+                print(f"Session-end protocol failed: {e}", file=sys.stderr)
+        if not config.ephemeral:
+            harness.archive_conversation()
+            harness.commit_memory()
+    return exit_code
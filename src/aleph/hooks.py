@@ -3,55 +3,92 @@
 import json
 import os
 import subprocess
+import time
 from datetime import date, datetime
 from pathlib import Path
 
-import yaml
-
 from claude_agent_sdk import (
     HookContext,
     HookInput,
     HookJSONOutput,
 )
 
+from .skills import load_skill_body
+
+
+def _touch_marker(path: Path) -> None:
+    """Ensure an (empty) marker file exists.
+
+    Only existence matters, so unlike Path.touch() this skips the utime
+    call on the open-and-close path.
+    """
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC, 0o666))
+
+
+# Directory mtimes younger than this may still change within the same tick
+_MTIME_SETTLE_NS = 1_000_000_000
+
 
 def create_inbox_check_hook(inbox_path: Path):
     """Create a PostToolUse hook that checks for unread messages after every tool call.
 
     Returns summaries of unread messages as additionalContext.
     """
+    # Inbox mtime as of the last scan that found nothing to report. Until the
+    # directory changes (a message arrives, a marker is written) there is
+    # nothing new to find, so the hook costs one stat.
+    quiet_mtime = None
 
     async def inbox_check_hook(
         input_data: HookInput, tool_use_id: str | None, context: HookContext
     ) -> HookJSONOutput:
-        if not inbox_path.exists():
+        nonlocal quiet_mtime
+        try:
+            mtime = os.stat(inbox_path).st_mtime_ns
+        except OSError:
+            return {}
+        if mtime == quiet_mtime:
             return {}
 
+        # One directory read: read markers are found by name, and DirEntry
+        # caches the file type, so unchanged entries cost no stat calls.
+        try:
+            with os.scandir(inbox_path) as it:
+                entries = list(it)
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+        names = {e.name for e in entries}
+        unread = sorted(
+            e.name for e in entries
+            if e.name.endswith(".md") and e.name != ".md"
+            and e.name[:-3] + ".read" not in names and e.is_file()
+        )
+
         summaries = []
         to_mark = []
-        for msg_file in sorted(inbox_path.iterdir()):
-            if msg_file.is_file() and msg_file.suffix == ".md":
-                # Check for read marker
-                read_marker = msg_file.with_suffix(".read")
-                if read_marker.exists():
-                    continue
-
-                # Extract summary and channel from frontmatter
-                parsed = parse_message(msg_file)
-                if parsed and parsed["summary"]:
-                    if parsed["channel"]:
-                        prefix = f"[Channel: {parsed['channel']}]"
-                    else:
-                        prefix = "[Message]"
-                    summaries.append(f"{prefix}: {parsed['summary']} — Full message at {msg_file}")
-                    to_mark.append(read_marker)
+        for name in unread:
+            msg_file = inbox_path / name
+
+            # Extract summary and channel from frontmatter
+            parsed = parse_message_header(msg_file)
+            if parsed and parsed["summary"]:
+                if parsed["channel"]:
+                    prefix = f"[Channel: {parsed['channel']}]"
+                else:
+                    prefix = "[Message]"
+                summaries.append(f"{prefix}: {parsed['summary']} — Full message at {msg_file}")
+                to_mark.append(msg_file.with_suffix(".read"))
 
         if not summaries:
+            # A write in the same timestamp tick as this scan wouldn't move the
+            # mtime, so only trust one that has had time to settle.
+            if time.time_ns() - mtime > _MTIME_SETTLE_NS:
+                quiet_mtime = mtime
             return {}
 
         # Mark as read so subsequent hook fires don't re-display
         for marker in to_mark:
-            marker.touch()
+            _touch_marker(marker)
 
         return {
             "hookSpecificOutput": {
@@ -80,17 +117,10 @@ def create_skill_context_hook(skills_path: Path):
         if not name:
             return {}
 
-        skill_md = skills_path / name / "SKILL.md"
-        if not skill_md.exists():
+        content = load_skill_body(skills_path / name / "SKILL.md")
+        if content is None:
             return {}
 
-        content = skill_md.read_text()
-
-        # Strip YAML frontmatter
-        if content.startswith("---"):
-            end = content.index("---", 3)
-            content = content[end + 3:].strip()
-
         return {
             "hookSpecificOutput": {
                 "hookEventName": "PostToolUse",
@@ -141,8 +171,7 @@ def create_read_tracking_hook(inbox_path: Path, file_state=None):
 
         # It's an inbox file — mark it as read
         if file_path.suffix == ".md" and file_path.exists():
-            read_marker = file_path.with_suffix(".read")
-            read_marker.touch()
+            _touch_marker(file_path.with_suffix(".read"))
 
         return {}
 
@@ -299,6 +328,8 @@ def create_plan_nudge_hook(plan_path: Path, interval: int = 20):
         if not plan_path.exists():
             return {}
 
+        import yaml
+
         try:
             data = yaml.safe_load(plan_path.read_text())
         except (yaml.YAMLError, OSError):
@@ -356,8 +387,6 @@ def create_worklog_hooks(worklog_path: Path, interval_minutes: int = 5):
     async def stop_hook(
         input_data: HookInput, tool_use_id: str | None, context: HookContext
     ) -> HookJSONOutput:
-        import time
-
         # Don't recurse — if we already blocked once, let the agent stop.
         # Clear pending_cutoff so a stale flag doesn't fire on a later tool call.
         if input_data.get("stop_hook_active", False):
@@ -401,6 +430,8 @@ def create_worklog_hooks(worklog_path: Path, interval_minutes: int = 5):
 
 def _get_session_timestamp(path: Path) -> datetime:
     """Extract timestamp from session file frontmatter, falling back to file mtime."""
+    import yaml
+
     try:
         text = path.read_text()
         if text.startswith("---"):
@@ -574,7 +605,14 @@ def parse_message(msg_file: Path) -> dict | None:
         result["body"] = text.strip()
         return result
 
-    for line in lines[1:fm_end]:
+    _parse_header_fields(lines[1:fm_end], result)
+    result["body"] = "\n".join(lines[fm_end + 1:]).strip()
+    return result
+
+
+def _parse_header_fields(lines: list[str], result: dict) -> None:
+    """Fill from/summary/priority/channel in result from frontmatter lines."""
+    for line in lines:
         if line.startswith("from:"):
             result["from"] = line[len("from:"):].strip().strip('"').strip("'")
         elif line.startswith("summary:"):
@@ -584,13 +622,67 @@ def parse_message(msg_file: Path) -> dict | None:
         elif line.startswith("channel:"):
             result["channel"] = line[len("channel:"):].strip().strip('"').strip("'")
 
-    result["body"] = "\n".join(lines[fm_end + 1:]).strip()
+
+# Message headers are parsed from this many leading characters; only a header
+# that runs past them costs a full read.
+_MSG_HEAD_CHARS = 8192
+
+
+def parse_message_header(msg_file: Path) -> dict | None:
+    """parse_message() without the body, reading only the head of the file.
+
+    Returns the same keys with body left empty, or None if the file can't
+    be read.
+    """
+    try:
+        with open(msg_file) as f:
+            head = f.read(_MSG_HEAD_CHARS)
+    except OSError:
+        return None
+    if len(head) < _MSG_HEAD_CHARS:
+        lines = head.split("\n")
+    else:
+        # Truncated: drop the last line, which may be cut short
+        lines = head.split("\n")[:-1]
+
+    result = {
+        "from": "",
+        "summary": "",
+        "priority": "normal",
+        "channel": "",
+        "body": "",
+        "path": str(msg_file),
+    }
+
+    if not head.startswith("---"):
+        # No frontmatter — first line of the stripped text is the summary
+        if len(head) < _MSG_HEAD_CHARS:
+            first_line = head.strip().split("\n")[0]
+        else:
+            first_line, _, rest = head.lstrip().partition("\n")
+            if not rest.strip():
+                return _without_body(parse_message(msg_file))
+        result["summary"] = first_line[:200]
+        return result
+
+    for i, line in enumerate(lines[1:], 1):
+        if line.strip() == "---":
+            _parse_header_fields(lines[1:i], result)
+            return result
+    if len(head) == _MSG_HEAD_CHARS:
+        return _without_body(parse_message(msg_file))
     return result
 
 
+def _without_body(parsed: dict | None) -> dict | None:
+    if parsed is not None:
+        parsed["body"] = ""
+    return parsed
+
+
 def _extract_summary(msg_file: Path) -> str | None:
     """Extract the summary field from a message file's YAML frontmatter."""
-    parsed = parse_message(msg_file)
+    parsed = parse_message_header(msg_file)
     if parsed is None:
         return None
     return parsed["summary"] or None
@@ -0,0 +1,114 @@
+"""Agent naming and session-registry lookup.
+
+Stdlib only (orjson when installed), so the CLI can pick an agent ID before
+the tmux launch without importing the harness or the agent SDK.
+"""
+
+import functools
+import json
+import os
+import random
+import uuid
+from pathlib import Path
+
+# Usual tmux install locations (Homebrew on Apple Silicon, Homebrew on Intel /
+# source builds, distro packages), probed before walking $PATH.
+_TMUX_CANDIDATES = ("/opt/homebrew/bin/tmux", "/usr/local/bin/tmux", "/usr/bin/tmux")
+
+# Session registry (de)serialization on bytes; orjson when available.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch the stdlib exception either way.
+try:
+    import orjson
+
+    load_registry = orjson.loads
+
+    def dump_registry(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    load_registry = json.loads
+
+    def dump_registry(obj) -> bytes:
+        return (json.dumps(obj, indent=2) + "\n").encode()
+
+_ADJECTIVES = [
+    "amber", "ash", "black", "blue", "bold", "bright", "calm", "cold",
+    "coral", "crimson", "crystal", "dark", "dawn", "deep", "dusk", "ember",
+    "far", "first", "frost", "gold", "green", "grey", "high", "iron",
+    "jade", "keen", "last", "lone", "lost", "low", "moss", "new",
+    "old", "pale", "quiet", "red", "shadow", "silver", "still", "stone",
+    "storm", "sun", "swift", "thorn", "warm", "white", "wild",
+]
+
+_NOUNS = [
+    "bay", "bear", "blade", "brook", "cairn", "cliff", "cove", "crane",
+    "crow", "dale", "deer", "drake", "dune", "elk", "falcon", "fern",
+    "field", "forge", "fox", "gate", "glade", "glen", "grove", "hare",
+    "haven", "hawk", "heron", "isle", "jay", "keep", "lake", "lark",
+    "lynx", "marsh", "moth", "owl", "peak", "pike", "pine", "pond",
+    "raven", "reach", "reef", "ridge", "seal", "shore", "spire", "vale",
+    "vole", "ward", "wolf", "wren",
+]
+
+
+@functools.lru_cache(maxsize=1)
+def tmux_bin() -> str | None:
+    """Resolve the tmux executable, or None if it isn't installed."""
+    found = next((p for p in _TMUX_CANDIDATES if os.access(p, os.X_OK)), None)
+    if found is None:
+        import shutil
+        found = shutil.which("tmux")
+    return found
+
+
+def generate_agent_name() -> str:
+    """Generate a human-readable agent name like 'aleph-frost-hawk'.
+
+    Checks running tmux sessions to avoid collisions with active agents.
+    Historical reuse is fine — date-stamped files (worklogs, summaries,
+    conversation archives) prevent data loss, and transient state (plans,
+    inbox, registry entries) is meant to be overwritten.
+
+    Falls back to hex UUID after 20 attempts.
+    """
+    import subprocess
+
+    # Get running tmux session names for collision check
+    running: set[str] = set()
+    tmux = tmux_bin()
+    if tmux:
+        try:
+            result = subprocess.run(
+                [tmux, "list-sessions", "-F", "#{session_name}"],
+                capture_output=True, text=True, timeout=5,
+            )
+            if result.returncode == 0:
+                running = set(result.stdout.strip().splitlines())
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
+    for _ in range(20):
+        name = f"aleph-{random.choice(_ADJECTIVES)}-{random.choice(_NOUNS)}"
+        if name not in running:
+            return name
+    # Extremely unlikely fallback
+    return f"aleph-{uuid.uuid4().hex[:8]}"
+
+
+def most_recent_agent_id(home: Path) -> str | None:
+    """Look up the most recently started agent ID from the session registry.
+
+    Used by --continue to reuse the same agent ID instead of generating a new one.
+    Returns None if the registry doesn't exist or is empty.
+    """
+    registry_path = home / "logs" / "session-registry.json"
+    if not registry_path.exists():
+        return None
+    try:
+        registry = load_registry(registry_path.read_bytes())
+    except (json.JSONDecodeError, OSError):
+        return None
+    if not registry:
+        return None
+    # Sort by started_at descending, return the most recent
+    return max(registry, key=lambda k: registry[k].get("started_at", ""))
@@ -0,0 +1,36 @@
+"""Skill instruction loading shared by the activate_skill tool and its context hook."""
+
+import os
+from pathlib import Path
+
+# SKILL.md path -> (mtime_ns, size, instructions with frontmatter stripped)
+_SKILL_BODY_CACHE: dict[str, tuple[int, int, str]] = {}
+
+
+def load_skill_body(skill_md: Path) -> str | None:
+    """Instructions from a SKILL.md (frontmatter stripped), or None if it's missing.
+
+    Cached by (mtime, size): activating a skill runs both the activate_skill
+    tool and the context hook, and neither re-reads an unchanged file.
+    """
+    try:
+        st = os.stat(skill_md)
+    except OSError:
+        return None
+    key = os.fspath(skill_md)
+    cached = _SKILL_BODY_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    try:
+        content = skill_md.read_text()
+    except OSError:
+        return None
+
+    # Strip YAML frontmatter — the model doesn't need the metadata
+    if content.startswith("---"):
+        end = content.find("---", 3)
+        if end != -1:  # malformed frontmatter: return as-is
+            content = content[end + 3:].strip()
+
+    _SKILL_BODY_CACHE[key] = (st.st_mtime_ns, st.st_size, content)
+    return content
@@ -5,10 +5,10 @@ import os
 from datetime import datetime, timezone
 from pathlib import Path
 
-import yaml
 from claude_agent_sdk import create_sdk_mcp_server, tool
 
 from .shell import PersistentShell
+from .skills import load_skill_body
 
 
 # ---------------------------------------------------------------------------
@@ -598,24 +598,14 @@ def create_aleph_mcp_server(
     )
     async def activate_skill(args: dict) -> dict:
         name = args["name"]
-        skill_md = skills_path / name / "SKILL.md"
+        content = load_skill_body(skills_path / name / "SKILL.md")
 
-        if not skill_md.exists():
+        if content is None:
             return {
                 "content": [{"type": "text", "text": f"Error: skill '{name}' not found."}],
                 "isError": True,
             }
 
-        content = skill_md.read_text()
-
-        # Strip YAML frontmatter — the model doesn't need the metadata
-        if content.startswith("---"):
-            try:
-                end = content.index("---", 3)
-                content = content[end + 3:].strip()
-            except ValueError:
-                pass  # malformed frontmatter, return as-is
-
         return {"content": [{"type": "text", "text": content}]}
 
     # ------------------------------------------------------------------
@@ -965,6 +955,8 @@ def create_aleph_mcp_server(
             ],
         }
 
+        import yaml
+
         plan_path = _plan_file()
         plan_path.parent.mkdir(parents=True, exist_ok=True)
         plan_path.write_text(yaml.dump(plan_data, default_flow_style=False, sort_keys=False))
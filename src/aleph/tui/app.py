@@ -980,7 +980,7 @@ class AlephApp:
         # Let _send_and_receive drain remaining messages naturally (it sees
         # _interrupt_in_flight and discards them until ResultMessage).
         # Schedule a safety cancel in case the subprocess never responds.
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         loop.call_later(5.0, self._force_cancel_receive)
 
     def _force_cancel_receive(self) -> None:
@@ -0,0 +1,71 @@
+"""Ledger reads and the legacy ledger migration in tools/lib/budget.py."""
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+LIB_DIR = Path(__file__).resolve().parent.parent / "defaults" / "tools" / "lib"
+
+
+@pytest.fixture
+def budget(tmp_path, monkeypatch):
+    """budget with its paths rooted in a temporary home."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    import budget
+
+    return importlib.reload(budget)
+
+
+def _entry(tool, cost, ts_ns):
+    return {"timestamp": "2026-01-01T00:00:00+00:00", "ts_ns": ts_ns, "tool": tool, "cost": cost}
+
+
+def test_torn_ledger_line_is_skipped(budget, capsys):
+    budget.LEDGER_FILE.parent.mkdir(parents=True)
+    budget.LEDGER_FILE.write_text(
+        json.dumps(_entry("a", 0.5, 1)) + "\n"
+        + '{"timestamp": "2026-01-0\n'
+        + json.dumps(_entry("b", 0.25, 2)) + "\n"
+    )
+    entries = budget.get_ledger()["entries"]
+    assert [e["tool"] for e in entries] == ["a", "b"]
+    assert "line 2" in capsys.readouterr().err
+    # Later budget reads keep working
+    assert budget.summary()
+
+
+def test_concurrent_legacy_migration_runs_once(tmp_path):
+    usage = tmp_path / ".aleph" / "usage"
+    usage.mkdir(parents=True)
+    legacy = [_entry(f"t{i}", 0.01, i) for i in range(5000)]
+    (usage / "ledger.json").write_text(json.dumps({"entries": legacy}))
+
+    env = {**os.environ, "HOME": str(tmp_path)}
+    go = tmp_path / "go"
+    # Every process imports first, then all read the ledger at once
+    code = (
+        "import os, time, budget\n"
+        f"while not os.path.exists({str(go)!r}): time.sleep(0.001)\n"
+        "print(len(budget.get_ledger()['entries']))\n"
+    )
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", code], cwd=LIB_DIR, env=env,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        )
+        for _ in range(8)
+    ]
+    go.touch()
+    results = [p.communicate() for p in procs]
+    assert [p.returncode for p in procs] == [0] * 8, [err for _, err in results]
+    assert {out.strip() for out, _ in results} == {"5000"}
+
+    lines = (usage / "ledger.jsonl").read_text().splitlines()
+    assert len(lines) == 5000
+    assert (usage / "ledger.json.bak").exists()
+    assert not (usage / "ledger.json").exists()
@@ -0,0 +1,54 @@
+"""Tool and skill discovery in aleph.harness."""
+
+import os
+
+from aleph import harness
+
+
+def _write_tool(path, description):
+    path.write_text(
+        "#!/usr/bin/env python3\n"
+        "# ---\n"
+        "# name: big\n"
+        f"# description: {description}\n"
+        "# ---\n"
+        "print('hi')\n"
+    )
+    return os.fspath(path), path.stat().st_mtime_ns
+
+
+def test_tool_header_within_first_read(tmp_path):
+    path, mtime = _write_tool(tmp_path / "small.py", "short")
+    assert harness._cached_tool_header(path, mtime) == {"name": "big", "description": "short"}
+
+
+def test_tool_header_longer_than_first_read(tmp_path):
+    description = "x" * (harness._TOOL_HEADER_MAX_BYTES + 1000)
+    path, mtime = _write_tool(tmp_path / "big.py", description)
+    header = harness._cached_tool_header(path, mtime)
+    assert header["description"] == description
+
+
+def _write_skill(skills, name, description):
+    skill = skills / name
+    skill.mkdir(exist_ok=True)
+    (skill / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {description}\n---\nBody\n")
+    return skill / "SKILL.md"
+
+
+def test_skills_snapshot_follows_edits_and_new_skills(tmp_path):
+    skills = tmp_path / "skills"
+    skills.mkdir()
+    skill_md = _write_skill(skills, "alpha", "first")
+    assert [s["description"] for s in harness._discover_skills(skills)] == ["first"]
+
+    skill_md.write_text("---\nname: alpha\ndescription: edited\n---\nBody\n")
+    st = skill_md.stat()
+    os.utime(skill_md, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert [s["description"] for s in harness._discover_skills(skills)] == ["edited"]
+
+    _write_skill(skills, "beta", "second")
+    st = skills.stat()
+    os.utime(skills, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    _, catalog = harness._skills_snapshot(skills)
+    assert "**alpha**" in catalog and "**beta**" in catalog